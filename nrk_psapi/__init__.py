@@ -2,7 +2,7 @@
 
 from .api import NrkPodcastAPI
 from .auth import NrkAuthClient, NrkUserLoginDetails
-from .caching import clear_cache, disable_cache, get_cache
+from .caching import clear_cache, disable_cache, get_cache, invalidate, invalidate_prefix
 from .exceptions import NrkPsApiError
 from .models.catalog import Episode, Podcast, Series
 from .models.playback import Asset, Playable
@@ -16,6 +16,8 @@ __all__ = [
     "disable_cache",
     "Episode",
     "get_cache",
+    "invalidate",
+    "invalidate_prefix",
     "NrkAuthClient",
     "NrkPodcastAPI",
     "NrkPodcastFeed",
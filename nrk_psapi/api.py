@@ -3,15 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from http import HTTPStatus
+import math
 from pathlib import Path
 import socket
+import time
 from typing import TYPE_CHECKING
 
 import aiofiles
 from aiohttp.client import ClientError, ClientResponse, ClientResponseError, ClientSession
+from aiohttp.connector import BaseConnector, TCPConnector
 from aiohttp.hdrs import METH_GET, METH_POST, METH_PUT
 import async_timeout
 import orjson
@@ -19,14 +24,47 @@ import platformdirs
 from yarl import URL
 
 from .auth import NrkAuthClient
-from .caching import cache, disable_cache, set_cache_dir
-from .const import LOGGER as _LOGGER, NRK_RADIO_INTERACTION_BASE_URL, PSAPI_BASE_URL
+from .caching import (
+    CacheWriteBatch,
+    ValidatedResponse,
+    cache,
+    disable_cache,
+    flush_cache_writes,
+    get_raw_response,
+    get_validated_response,
+    record_response_headers,
+    run_cache_culling,
+    set_cache_backend,
+    set_cache_dir,
+    set_cache_executor_max_workers,
+    set_cache_raw_responses,
+    set_cache_shards,
+    set_cache_size_limit,
+    set_cache_ttl,
+    set_cache_ttl_from_headers,
+    set_cache_write_behind,
+    set_memory_cache_limits,
+    set_raw_response,
+    set_stale_while_revalidate,
+    set_validated_response,
+)
+from .const import (
+    CACHE_EXECUTOR_MAX_WORKERS,
+    DISK_CACHE_DURATION_LONG,
+    DISK_CACHE_DURATION_SHORT,
+    DISK_CACHE_SIZE_LIMIT,
+    LOGGER as _LOGGER,
+    MEMORY_CACHE_MAX_ENTRIES,
+    NRK_RADIO_INTERACTION_BASE_URL,
+    PSAPI_BASE_URL,
+)
 from .exceptions import (
     NrkPsApiConnectionError,
     NrkPsApiConnectionTimeoutError,
     NrkPsApiError,
     NrkPsApiNotFoundError,
     NrkPsApiRateLimitError,
+    NrkPsApiServerError,
     NrkPsAuthorizationError,
 )
 from .models.catalog import (
@@ -70,16 +108,99 @@ from .models.userdata import (
     UserFavouriteNewEpisodesCountResponse,
     UserFavouritesResponse,
 )
+from .throttling import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    CircuitState,
+    HedgePolicy,
+    RetryPolicy,
+    TokenBucket,
+    get_endpoint_family,
+)
 from .utils import (
     fetch_file_info,
     get_nested_items,
+    parse_retry_after,
     tiled_images,
 )
 from .version import __version__
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
     from os import PathLike
 
+    from .cache_backends import CacheBackend
+
+
+def _season_tag(parent_id: str, season_id: str | None) -> str | None:
+    """Season ids are only unique within a series, so season tags are namespaced by it."""
+    return None if season_id is None else f"{parent_id}/{season_id}"
+
+
+def _podcast_tags(result, podcast_id: str, season_id: str | None = None, **_) -> dict:
+    """Tag a result with the podcast, season and episodes it contains."""
+    tags = {"podcast": podcast_id, "season": _season_tag(podcast_id, season_id)}
+    if isinstance(result, list):
+        tags["episode"] = [episode.episode_id for episode in result]
+    return tags
+
+
+def _series_tags(result, series_id: str, season_id: str | None = None, **_) -> dict:
+    """Tag a result with the series, season and episodes it contains."""
+    tags = {"series": series_id, "season": _season_tag(series_id, season_id)}
+    if isinstance(result, list):
+        tags["episode"] = [episode.episode_id for episode in result]
+    return tags
+
+
+def _episode_tags(_result, podcast_id: str, episode_id: str, **_) -> dict:
+    return {"podcast": podcast_id, "episode": episode_id}
+
+
+def _media_tags(_result, item_id: str, *, program=False, channel=False, **_) -> dict:
+    if channel:
+        return {"channel": item_id}
+    return {"program" if program else "episode": item_id}
+
+
+def _has_next_page(data: dict) -> bool:
+    return "_links" in data and "next" in data["_links"]
+
+
+async def _gather_pages(aws: Iterable[Awaitable]) -> list:
+    """Await page requests concurrently, cancelling the rest when one of them fails."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _trim_missing_pages(uri: str, pages: list, first_page: int) -> list:
+    """Drop the missing pages at the end, e.g. of a stale total count, and raise for missing pages before them."""
+    pages = list(pages)
+    while pages and pages[-1] is None:
+        pages.pop()
+    for page_no, page_data in enumerate(pages, start=first_page):
+        if page_data is None:
+            raise NrkPsApiNotFoundError(f"Page {page_no} of {uri} not found")
+    return pages
+
+
+def _get_page_count(data: dict, page_size: int) -> int | None:
+    """Get the total number of pages of a paged response, if the response reveals it."""
+    total_count = data.get("totalCount", data.get("total"))
+    if isinstance(total_count, int):
+        return math.ceil(total_count / page_size)
+    last_href = data.get("_links", {}).get("last", {}).get("href")
+    if last_href is not None:
+        last_page = URL(last_href).query.get("page")
+        if last_page is not None and last_page.isdigit():
+            return int(last_page)
+    return None
+
 
 @dataclass
 class NrkPodcastAPI:
@@ -97,13 +218,89 @@ class NrkPodcastAPI:
     1. Value of environment variable `NRK_PSAPI_CACHE_DIR`
     2. `~/.cache/nrk-psapi`
     """
+    memory_cache_max_entries: int | None = MEMORY_CACHE_MAX_ENTRIES
+    """Maximum number of entries in the in-process cache in front of the disk cache, 0 disables it."""
+    memory_cache_max_size: int | None = None
+    """Maximum total size in bytes of the in-process cache, defaults to no limit."""
+    cache_stale_while_revalidate: float | None = None
+    """Time in seconds an expired cache entry is still served while it is refreshed in the background,
+    or while the NRK API is unavailable. Defaults to None (disabled)."""
+    cache_ttl: dict[str, float | None] | None = None
+    """Time in seconds to cache results for, by method name, e.g. `{"get_live_channel": 30}`.
+    Overrides the defaults of the cached methods."""
+    cache_ttl_from_headers: bool = False
+    """Derive the time to cache results for from the Cache-Control/Expires headers of the API responses,
+    defaults to False."""
+    cache_raw_responses: bool = False
+    """Cache the raw JSON payloads of the API responses on disk, instead of the models built from them,
+    defaults to False. Models are built again from the cached payloads when they are missing from the
+    in-process cache. Cheaper to store, and leaves cached payloads usable by :meth:`get_raw`."""
+    cache_backend: CacheBackend | None = None
+    """Backend of the shared cache behind the in-process cache, e.g. a
+    :class:`~.cache_backends.RedisBackend` to share one cache between hosts.
+    Defaults to the disk cache in :attr:`cache_directory`."""
+    cache_shards: int | None = None
+    """Number of SQLite databases to shard the disk cache into, to spread the writes of many processes
+    sharing the cache directory. Processes sharing a cache directory must use the same number of shards.
+    Defaults to None (not sharded)."""
+    cache_write_behind: bool = False
+    """Store results in the shared cache in the background, in batches, instead of making callers wait
+    for the writes. Queued writes are stored when the client is closed. Defaults to False."""
+    cache_executor_max_workers: int = CACHE_EXECUTOR_MAX_WORKERS
+    """Maximum number of threads making blocking calls to the shared cache, separate from the default
+    executor of the event loop. Defaults to 4."""
+    cache_size_limit: int | None = DISK_CACHE_SIZE_LIMIT
+    """Size limit in bytes of the disk cache, None for no limit. Defaults to 5GB."""
+    cache_eviction_policy: str = "least-recently-stored"
+    """Which entries to evict when the disk cache is above its size limit, one of `least-recently-stored`
+    (default), `least-recently-used` or `least-frequently-used`. The last two cost a write per disk cache hit."""
+    cache_cull_interval: float | None = 300
+    """Time in seconds between culling expired entries from the disk cache and evicting entries above
+    its size limit, in the background while the client is open as an async context manager.
+    None disables culling. Defaults to 300."""
     request_timeout: int = 15
     """Request timeout in seconds, defaults to 15."""
     session: ClientSession | None = None
     """Optional web session to use for requests."""
+    connector: BaseConnector | None = None
+    """Optional connection pool to use for requests. If not set, one is created from the connection
+    settings below, and shared by all requests to NRK hosts, including authentication."""
+    connection_limit: int = 100
+    """Maximum number of simultaneous connections, 0 for no limit. Defaults to 100."""
+    connection_limit_per_host: int = 0
+    """Maximum number of simultaneous connections to a single host, 0 for no limit (default)."""
+    keepalive_timeout: float = 60
+    """Time in seconds to keep idle connections open for reuse, defaults to 60."""
+    dns_cache_ttl: int | None = 300
+    """Time in seconds to cache DNS lookups for, None to cache forever. Defaults to 300."""
+    rate_limit: float | None = None
+    """Maximum number of requests per second, defaults to no limit."""
+    max_concurrent_requests: int | None = None
+    """Upper bound of the adaptive concurrency limit, defaults to no limit. The limit is decreased
+    when the API responds with rate limiting or times out, and grows back on successful requests."""
+    retry_policy: RetryPolicy | None = None
+    """Policy for retrying idempotent requests that failed with a transient error, defaults to no retries."""
+    hedge_policy: HedgePolicy | None = None
+    """Policy for hedging latency-critical requests (playback manifests and episodes), defaults to
+    None (disabled). Hedged requests count against the rate limit like any other request."""
+    circuit_breaker_threshold: int | None = None
+    """Number of consecutive failed requests to an endpoint family (catalog, playback, search, pages,
+    userdata, ...) after which further requests to it fail fast, defaults to None (disabled)."""
+    circuit_breaker_recovery_time: float = 30
+    """Time in seconds to fail fast before probing a failing endpoint family again, defaults to 30."""
+    bulk_concurrency: int = 10
+    """Maximum number of concurrent requests made by bulk methods like :meth:`get_episodes` and
+    :meth:`get_podcasts`, defaults to 10."""
+    page_concurrency: int = 1
+    """Maximum number of pages fetched concurrently when requesting all pages, defaults to 1 (sequential)."""
 
     _conf_dir = platformdirs.user_config_dir(__package__, ensure_exists=True)
     _close_session: bool = False
+    _close_connector: bool = False
+    _rate_limiter: TokenBucket | None = field(default=None, init=False, repr=False)
+    _concurrency_limiter: AdaptiveConcurrencyLimiter | None = field(default=None, init=False, repr=False)
+    _circuit_breakers: dict[str, CircuitBreaker] = field(default_factory=dict, init=False, repr=False)
+    _cull_task: asyncio.Task | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
         if not self.enable_cache:
@@ -113,6 +310,31 @@ class NrkPodcastAPI:
         if self.cache_directory is not None:
             set_cache_dir(self.cache_directory)
 
+        set_memory_cache_limits(self.memory_cache_max_entries, self.memory_cache_max_size)
+        set_cache_shards(self.cache_shards)
+        if self.cache_backend is not None:
+            set_cache_backend(self.cache_backend)
+        set_cache_size_limit(self.cache_size_limit, self.cache_eviction_policy)
+        set_cache_executor_max_workers(self.cache_executor_max_workers)
+        if self.cache_write_behind:
+            set_cache_write_behind(True)
+
+        if self.cache_stale_while_revalidate is not None:
+            set_stale_while_revalidate(self.cache_stale_while_revalidate)
+
+        for name, expire in (self.cache_ttl or {}).items():
+            set_cache_ttl(name, expire)
+
+        if self.cache_ttl_from_headers:
+            set_cache_ttl_from_headers(True)
+        if self.cache_raw_responses:
+            set_cache_raw_responses(True)
+
+        if self.rate_limit is not None:
+            self._rate_limiter = TokenBucket(self.rate_limit)
+        if self.max_concurrent_requests is not None:
+            self._concurrency_limiter = AdaptiveConcurrencyLimiter(self.max_concurrent_requests)
+
     async def save_credentials(self, filename: PathLike | None = None) -> None:
         """Save the current authentication credentials to a file.
 
@@ -150,6 +372,29 @@ class NrkPodcastAPI:
             if data:
                 self.auth_client.set_credentials(data)
 
+    @property
+    def concurrency_limit(self) -> int | None:
+        """Current adaptive concurrency limit, or None if concurrency is not limited."""
+        if self._concurrency_limiter is None:
+            return None
+        return self._concurrency_limiter.limit
+
+    @property
+    def circuit_states(self) -> dict[str, CircuitState]:
+        """Current circuit breaker state by endpoint family."""
+        return {family: breaker.state for family, breaker in self._circuit_breakers.items()}
+
+    def _get_circuit_breaker(self, url: URL) -> CircuitBreaker | None:
+        if self.circuit_breaker_threshold is None:
+            return None
+        family = get_endpoint_family(url)
+        if family not in self._circuit_breakers:
+            self._circuit_breakers[family] = CircuitBreaker(
+                self.circuit_breaker_threshold,
+                self.circuit_breaker_recovery_time,
+            )
+        return self._circuit_breakers[family]
+
     @property
     def request_header(self) -> dict[str, str]:
         """Generate a header for HTTP requests to the server."""
@@ -158,30 +403,98 @@ class NrkPodcastAPI:
             "User-Agent": self.user_agent or f"NrkPodcastAPI/{__version__}",
         }
 
+    def _get_connector(self) -> BaseConnector:
+        """Get the connection pool, creating it if needed."""
+        if self.connector is None:
+            self.connector = TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+            )
+            _LOGGER.debug("New connection pool created.")
+            self._close_connector = True
+        if self.auth_client.session is None and self.auth_client.connector is None:
+            self.auth_client.connector = self.connector
+        return self.connector
+
+    def _start_cache_culling(self) -> None:
+        """Start culling the disk cache in the background, if it isn't already."""
+        if self.cache_cull_interval is None or not self.enable_cache:
+            return
+        if self._cull_task is None or self._cull_task.done():
+            self._cull_task = asyncio.create_task(run_cache_culling(self.cache_cull_interval))
+
+    def _get_session(self) -> ClientSession:
+        """Get the web session, creating one on the shared connection pool if needed."""
+        if self.session is None:
+            self.session = ClientSession(connector=self._get_connector(), connector_owner=False)
+            _LOGGER.debug("New session created.")
+            self._close_session = True
+        return self.session
+
     async def _request_paged_all(
         self,
         uri: str,
         method: str = METH_GET,
         items_key: str | None = None,
         page_size: int | None = None,
+        concurrency: int | None = None,
         **kwargs,
     ) -> list:
-        """Make a paged request."""
-        results = []
-        page = 1
+        """Make a paged request, returning the items of all pages in page order.
 
-        while True:
-            data = await self._request_paged(uri, method, page_size=page_size, page=page, **kwargs)
+        The first page is always fetched on its own. If :attr:`page_concurrency` (or ``concurrency``)
+        is larger than 1, the remaining pages are fetched concurrently: when the total number of
+        items is known from the first page, all remaining pages are requested at once (bounded by
+        the concurrency), otherwise pages are probed in windows until the last page is found.
+        """
+        if page_size is None:
+            page_size = 50
+        if concurrency is None:
+            concurrency = self.page_concurrency
 
-            items = get_nested_items(data, items_key)
-            results.extend(items)
+        data = await self._request_paged(uri, method, page_size=page_size, page=1, **kwargs)
+        results = list(get_nested_items(data, items_key))
+        if not _has_next_page(data):
+            return results
 
-            if "_links" in data and "next" in data["_links"]:
+        if concurrency <= 1:
+            page = 1
+            while _has_next_page(data):
                 page += 1
-            else:
-                break
-
-        return results
+                data = await self._request_paged(uri, method, page_size=page_size, page=page, **kwargs)
+                results.extend(get_nested_items(data, items_key))
+            return results
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_page(page_no: int):
+            async with semaphore:
+                try:
+                    return await self._request_paged(uri, method, page_size=page_size, page=page_no, **kwargs)
+                except NrkPsApiNotFoundError:
+                    return None
+
+        page_count = _get_page_count(data, page_size)
+        if page_count is not None:
+            pages = await _gather_pages(fetch_page(page_no) for page_no in range(2, page_count + 1))
+            for page_data in _trim_missing_pages(uri, pages, 2):
+                results.extend(get_nested_items(page_data, items_key))
+            return results
+
+        page = 2
+        while True:
+            pages = await _gather_pages(fetch_page(page_no) for page_no in range(page, page + concurrency))
+            trimmed = _trim_missing_pages(uri, pages, page)
+            for page_data in trimmed:
+                items = get_nested_items(page_data, items_key)
+                results.extend(items)
+                if not items or not _has_next_page(page_data):
+                    return results
+            if len(trimmed) < len(pages):
+                return results
+            page += concurrency
 
     async def _request_paged(
         self,
@@ -198,41 +511,230 @@ class NrkPodcastAPI:
             page = 1
         return await self._request(uri, method, params={"pageSize": page_size, "page": page}, **kwargs)
 
+    @staticmethod
+    async def _iter_pages(
+        fetch_page: Callable[[int], Awaitable[dict]],
+        has_next_page: Callable[[dict], bool] = _has_next_page,
+    ) -> AsyncIterator[dict]:
+        """Iterate over pages, prefetching the next page while the current one is consumed."""
+        page = 1
+        task = asyncio.ensure_future(fetch_page(page=page))
+        try:
+            while task is not None:
+                data = await task
+                task = None
+                if has_next_page(data):
+                    page += 1
+                    task = asyncio.ensure_future(fetch_page(page=page))
+                yield data
+        finally:
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, NrkPsApiError):
+                    await task
+
+    async def _iter_bulk(
+        self,
+        cached_function: Callable[..., Awaitable],
+        keys: list[tuple],
+        concurrency: int | None = None,
+        *,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[tuple[tuple, any]]:
+        """Call a cached method once for each unique key, yielding the results as they complete.
+
+        Cached results are looked up at once, and the rest are fetched concurrently, at most
+        `concurrency` (defaults to :attr:`bulk_concurrency`) at a time. The fetched results are
+        stored in the disk cache at once when done.
+        """
+        keys = list(dict.fromkeys(keys))
+        cached = await cached_function.__cache_get_many__([(self, *key) for key in keys])
+        for index, result in cached.items():
+            yield keys[index], result
+
+        semaphore = asyncio.Semaphore(concurrency or self.bulk_concurrency)
+        write_batch = CacheWriteBatch()
+
+        async def fetch(key: tuple):
+            async with semaphore:
+                try:
+                    with write_batch.collect():
+                        return key, await cached_function(*key)
+                except NrkPsApiError as err:
+                    if not return_exceptions:
+                        raise
+                    return key, err
+
+        tasks = [asyncio.ensure_future(fetch(key)) for index, key in enumerate(keys) if index not in cached]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await write_batch.flush()
+
     @staticmethod
     async def _request_check_status(response: ClientResponse):
+        if response.status == HTTPStatus.NOT_MODIFIED:
+            return
         if response.status == HTTPStatus.TOO_MANY_REQUESTS:
-            raise NrkPsApiRateLimitError("Too many requests to NRK API. Try again later.")
+            raise NrkPsApiRateLimitError(
+                "Too many requests to NRK API. Try again later.",
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
         if response.status == HTTPStatus.NOT_FOUND:
             raise NrkPsApiNotFoundError("Resource not found")
         if response.status == HTTPStatus.BAD_REQUEST:
             raise NrkPsApiError("Bad request syntax or unsupported method")
         if response.status == HTTPStatus.FORBIDDEN:
             raise NrkPsAuthorizationError("Authorization failed")
+        if HTTPStatus(response.status).is_server_error:
+            raise NrkPsApiServerError(
+                f"NRK API responded with {response.status} {response.reason}",
+                status=response.status,
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
         if not HTTPStatus(response.status).is_success:
             raise NrkPsApiError(response)
 
+    async def _send(self, method: str, url: URL, **kwargs) -> ClientResponse:
+        """Send a request, failing fast if the circuit breaker of its endpoint family is open."""
+        circuit_breaker = self._get_circuit_breaker(url)
+        if circuit_breaker is None:
+            return await self._send_retrying(method, url, **kwargs)
+        async with circuit_breaker.request():
+            return await self._send_retrying(method, url, **kwargs)
+
+    async def _send_retrying(self, method: str, url: URL, *, hedge: bool = False, **kwargs) -> ClientResponse:
+        """Send a request, retrying transient errors according to the retry policy."""
+        send = self._send_hedged if hedge and self.hedge_policy is not None else self._send_attempt
+        if self.retry_policy is None:
+            return await send(method, url, **kwargs)
+
+        self.retry_policy.on_request()
+        attempt = 0
+        while True:
+            try:
+                return await send(method, url, **kwargs)
+            except NrkPsApiError as err:  # noqa: PERF203
+                delay = self.retry_policy.get_retry_delay(method, attempt, err)
+                if delay is None:
+                    raise
+                attempt += 1
+                _LOGGER.debug(
+                    "Retrying %s API request to %s in %.2f seconds (attempt %s): %s",
+                    method,
+                    url,
+                    delay,
+                    attempt,
+                    err,
+                )
+                await asyncio.sleep(delay)
+
+    async def _send_hedged(self, method: str, url: URL, **kwargs) -> ClientResponse:
+        """Send a request, and duplicates of it if it is slow, returning the first response."""
+        family = get_endpoint_family(url)
+
+        async def attempt() -> ClientResponse:
+            started = time.monotonic()
+            response = await self._send_attempt(method, url, **kwargs)
+            self.hedge_policy.record(family, time.monotonic() - started)
+            return response
+
+        pending = {asyncio.ensure_future(attempt())}
+        hedges = 0
+        try:
+            while True:
+                timeout = (
+                    self.hedge_policy.get_delay(family) if hedges < self.hedge_policy.max_hedges else None
+                )
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    hedges += 1
+                    _LOGGER.debug("Hedging %s API request to %s (hedge %s)", method, url, hedges)
+                    pending.add(asyncio.ensure_future(attempt()))
+                    continue
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    return succeeded[0].result()
+                if not pending:
+                    raise next(iter(done)).exception()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _send_attempt(self, method: str, url: URL, **kwargs) -> ClientResponse:
+        """Send a request, throttled by the rate limiter and the adaptive concurrency limit."""
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+        if self._concurrency_limiter is None:
+            return await self._send_once(method, url, **kwargs)
+        async with self._concurrency_limiter.request():
+            return await self._send_once(method, url, **kwargs)
+
+    async def _send_once(self, method: str, url: URL, **kwargs) -> ClientResponse:
+        """Send a single request, and read the response body."""
+        try:
+            async with async_timeout.timeout(self.request_timeout):
+                response = await self._get_session().request(
+                    method,
+                    url,
+                    **kwargs,
+                    raise_for_status=self._request_check_status,
+                )
+                await response.read()
+        except asyncio.TimeoutError as exception:
+            raise NrkPsApiConnectionTimeoutError(
+                "Timeout occurred while connecting to NRK API"
+            ) from exception
+        except (
+            ClientError,
+            ClientResponseError,
+            socket.gaierror,
+        ) as exception:
+            msg = f"Error occurred while communicating with NRK API: {exception}"
+            raise NrkPsApiConnectionError(msg) from exception
+        return response
+
     async def _request(
         self,
         uri: str,
         method: str = METH_GET,
         base_url: str | None = None,
+        *,
+        hedge: bool = False,
+        raw: bool = False,
         **kwargs,
-    ) -> str | dict[any, any] | list[any] | None:
-        """Make a request."""
+    ) -> str | bytes | dict[any, any] | list[any] | None:
+        """Make a request, hedging it if `hedge` is set and a hedge policy is configured.
+
+        Returns the raw JSON payload instead of the decoded JSON if `raw` is set.
+        """
         if base_url is None:
             base_url = PSAPI_BASE_URL
         url = URL(base_url).join(URL(uri))
-        headers = kwargs.get("headers")
+        headers = kwargs.pop("headers", None)
         headers = self.request_header if headers is None else dict(headers)
 
         params = kwargs.get("params")
         if params is not None:
             kwargs.update(params={k: v for k, v in params.items() if v is not None})
 
-        if self.session is None:
-            self.session = ClientSession()
-            _LOGGER.debug("New session created.")
-            self._close_session = True
+        # Revalidate previously fetched responses with a conditional request
+        validated_response = None
+        if method == METH_GET:
+            validated_url = str(url.with_query(kwargs.get("params")))
+            if (payload := await get_raw_response(validated_url)) is not None:
+                _LOGGER.debug("Using cached response for %s.", validated_url)
+                return payload if raw else orjson.loads(payload)
+            validated_response = await get_validated_response(validated_url)
+            if validated_response is not None:
+                headers.update(validated_response.conditional_headers)
 
         _LOGGER.debug(
             "Executing %s API request to %s.",
@@ -240,38 +742,49 @@ class NrkPodcastAPI:
             url.with_query(kwargs.get("params")),
         )
 
-        try:
-            async with async_timeout.timeout(self.request_timeout):
-                response = await self.session.request(
-                    method,
-                    url,
-                    **kwargs,
-                    headers=headers,
-                    raise_for_status=self._request_check_status,
-                )
-        except asyncio.TimeoutError as exception:
-            raise NrkPsApiConnectionTimeoutError(
-                "Timeout occurred while connecting to NRK API"
-            ) from exception
-        except (
-            ClientError,
-            ClientResponseError,
-            socket.gaierror,
-        ) as exception:
-            msg = f"Error occurred while communicating with NRK API: {exception}"
-            raise NrkPsApiConnectionError(msg) from exception
+        response = await self._send(
+            method, url, headers=headers, hedge=hedge and method == METH_GET, **kwargs
+        )
 
         if response.status in [HTTPStatus.NO_CONTENT, HTTPStatus.ACCEPTED]:
             return None
+        record_response_headers(response.headers)
+        if response.status == HTTPStatus.NOT_MODIFIED and validated_response is not None:
+            _LOGGER.debug("Response not modified, reusing stored response.")
+            payload = orjson.dumps(validated_response.data)
+            await set_raw_response(validated_url, payload, response.headers)
+            return payload if raw else validated_response.data
         content_type = response.headers.get("Content-Type", "")
-        text = await response.text()
         if "application/json" not in content_type:
             msg = "Unexpected response from the NRK API"
             raise NrkPsApiError(
                 msg,
-                {"Content-Type": content_type, "response": text},
+                {"Content-Type": content_type, "response": await response.text()},
+            )
+        payload = await response.read()
+        data = orjson.loads(payload)
+        if method == METH_GET:
+            await set_raw_response(validated_url, payload, response.headers)
+            await set_validated_response(
+                validated_url,
+                ValidatedResponse(
+                    data,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                ),
             )
-        return orjson.loads(text)
+        return payload if raw else data
+
+    @cache(ignore=(0,))
+    async def get_raw(self, uri: str, **params: str | int) -> bytes:
+        """Get the raw JSON payload of an API endpoint, e.g. to forward it without building models.
+
+        Args:
+            uri(str): Path of the endpoint, e.g. `radio/catalog/podcast/{podcast_id}`.
+            **params: Query parameters.
+
+        """
+        return await self._request(uri, params=params or None, raw=True)
 
     async def ipcheck(self) -> IpCheck:
         """Check if IP is blocked."""
@@ -308,7 +821,7 @@ class NrkPodcastAPI:
             json=payload.to_dict(),
         )
 
-    @cache(ignore=(0,))
+    @cache(ignore=(0,), tags=_media_tags)
     async def get_playback_manifest(
         self,
         item_id: str,
@@ -334,10 +847,10 @@ class NrkPodcastAPI:
             endpoint = "/channel"
         else:
             endpoint = ""
-        result = await self._request(f"playback/manifest{endpoint}/{item_id}")
+        result = await self._request(f"playback/manifest{endpoint}/{item_id}", hedge=True)
         return PodcastManifest.from_dict(result)
 
-    @cache(ignore=(0,))
+    @cache(ignore=(0,), tags=_media_tags)
     async def get_playback_metadata(
         self,
         item_id: str,
@@ -366,7 +879,7 @@ class NrkPodcastAPI:
         result = await self._request(f"playback/metadata{endpoint}/{item_id}")
         return PodcastMetadata.from_dict(result)
 
-    @cache(ignore=(0,))
+    @cache(ignore=(0,), tags=_episode_tags)
     async def get_episode(self, podcast_id: str, episode_id: str) -> Episode:
         """Get episode.
 
@@ -375,10 +888,41 @@ class NrkPodcastAPI:
             episode_id(str): Episode ID.
 
         """
-        result = await self._request(f"radio/catalog/podcast/{podcast_id}/episodes/{episode_id}")
+        result = await self._request(f"radio/catalog/podcast/{podcast_id}/episodes/{episode_id}", hedge=True)
         return Episode.from_dict(result)
 
-    @cache(ignore=(0,))
+    async def get_episodes(
+        self,
+        episodes: Iterable[tuple[str, str]],
+        concurrency: int | None = None,
+    ) -> list[Episode | NrkPsApiError]:
+        """Get many episodes, possibly from different podcasts.
+
+        Cached episodes are looked up at once, and the rest are fetched concurrently. Each
+        episode is only fetched once, even if it is requested several times.
+
+        Args:
+            episodes(Iterable[tuple[str, str]]): Podcast ID and episode ID pairs.
+            concurrency(int, optional): Maximum number of concurrent requests. Defaults to :attr:`bulk_concurrency`.
+
+        Returns:
+            The episodes in the requested order. Episodes that could not be fetched are
+            replaced by the error that occurred.
+
+        """
+        episodes = [tuple(episode) for episode in episodes]
+        results = {
+            key: result
+            async for key, result in self._iter_bulk(
+                self.get_episode,
+                episodes,
+                concurrency,
+                return_exceptions=True,
+            )
+        }
+        return [results[key] for key in episodes]
+
+    @cache(expire=DISK_CACHE_DURATION_LONG, ignore=(0,), tags=_series_tags)
     async def get_series_type(self, series_id: str) -> SeriesType:
         """Get series type.
 
@@ -389,7 +933,7 @@ class NrkPodcastAPI:
         result = await self._request(f"radio/catalog/series/{series_id}/type")
         return SeriesType.from_str(result["seriesType"])
 
-    @cache(ignore=(0,))
+    @cache(expire=DISK_CACHE_DURATION_LONG, ignore=(0,), tags=_podcast_tags)
     async def get_podcast_type(self, podcast_id: str) -> SeriesType:
         """Get podcast type.
 
@@ -400,7 +944,7 @@ class NrkPodcastAPI:
         result = await self._request(f"radio/catalog/podcast/{podcast_id}/type")
         return SeriesType.from_str(result["seriesType"])
 
-    @cache(ignore=(0,))
+    @cache(ignore=(0,), tags=_series_tags)
     async def get_series_season(self, series_id: str, season_id: str) -> Season:
         """Get series season.
 
@@ -412,7 +956,7 @@ class NrkPodcastAPI:
         result = await self._request(f"radio/catalog/series/{series_id}/seasons/{season_id}")
         return Season.from_dict(result)
 
-    @cache(ignore=(0,))
+    @cache(ignore=(0,), tags=_series_tags)
     async def get_series_episodes(
         self,
         series_id: str,
@@ -451,7 +995,37 @@ class NrkPodcastAPI:
 
         return [Episode.from_dict(e) for e in result]
 
-    @cache(ignore=(0,))
+    async def iter_series_episodes(
+        self,
+        series_id: str,
+        season_id: str | None = None,
+        *,
+        page_size: int | None = None,
+    ) -> AsyncIterator[Episode]:
+        """Iterate over all series episodes, one page at a time.
+
+        The next page is fetched while the episodes of the current page are consumed.
+
+        Args:
+            series_id(str): Series ID.
+            season_id(str, optional): Season ID.
+            page_size(int, optional): Number of episodes to fetch per page (defaults to 50)
+
+        """
+        if season_id is not None:
+            uri = f"radio/catalog/series/{series_id}/seasons/{season_id}/episodes"
+        else:
+            uri = f"radio/catalog/series/{series_id}/episodes"
+
+        async for data in self._iter_pages(partial(self._request_paged, uri, page_size=page_size)):
+            for e in get_nested_items(data, "_embedded.episodes"):
+                yield Episode.from_dict(e)
+
+    @cache(
+        expire=DISK_CACHE_DURATION_SHORT,
+        ignore=(0,),
+        tags=lambda _result, channel_id, **_: {"channel": channel_id},
+    )
     async def get_live_channel(self, channel_id: str) -> Channel:
         """Get live channel.
 
@@ -462,7 +1036,7 @@ class NrkPodcastAPI:
         result = await self._request(f"radio/channels/livebuffer/{channel_id}")
         return Channel.from_dict(result["channel"])
 
-    @cache(ignore=(0,))
+    @cache(ignore=(0,), tags=lambda _result, program_id, **_: {"program": program_id})
     async def get_program(self, program_id: str) -> Program:
         """Get program.
 
@@ -473,7 +1047,7 @@ class NrkPodcastAPI:
         result = await self._request(f"radio/catalog/programs/{program_id}")
         return Program.from_dict(result)
 
-    @cache(ignore=(0,))
+    @cache(ignore=(0,), tags=_podcast_tags)
     async def get_podcast(
         self, podcast_id: str
     ) -> Podcast | PodcastStandard | PodcastUmbrella | PodcastSequential:
@@ -487,17 +1061,62 @@ class NrkPodcastAPI:
         return Podcast.from_dict(result)
 
     # @cache(ignore=(0,))
-    async def get_podcasts(self, podcast_ids: list[str]) -> list[Podcast]:
+    async def get_podcasts(
+        self,
+        podcast_ids: list[str],
+        concurrency: int | None = None,
+        *,
+        return_exceptions: bool = False,
+    ) -> list[Podcast | NrkPsApiError]:
         """Get podcasts.
 
+        Cached podcasts are looked up at once, and the rest are fetched concurrently.
+
         Args:
             podcast_ids(list[str]): List of podcast ids.
+            concurrency(int, optional): Maximum number of concurrent requests. Defaults to :attr:`bulk_concurrency`.
+            return_exceptions(bool, optional): Replace podcasts that could not be fetched by the error
+                that occurred, instead of raising it. Defaults to False.
 
         """
-        results = await asyncio.gather(*[self.get_podcast(podcast_id) for podcast_id in podcast_ids])
-        return list(results)
+        results = {
+            podcast_id: result
+            async for podcast_id, result in self.iter_podcasts(
+                podcast_ids,
+                concurrency,
+                return_exceptions=return_exceptions,
+            )
+        }
+        return [results[podcast_id] for podcast_id in podcast_ids]
 
-    @cache(ignore=(0,))
+    async def iter_podcasts(
+        self,
+        podcast_ids: list[str],
+        concurrency: int | None = None,
+        *,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[tuple[str, Podcast | NrkPsApiError]]:
+        """Iterate over podcasts as they are fetched, in no particular order.
+
+        Args:
+            podcast_ids(list[str]): List of podcast ids.
+            concurrency(int, optional): Maximum number of concurrent requests. Defaults to :attr:`bulk_concurrency`.
+            return_exceptions(bool, optional): Yield the error that occurred for podcasts that could not
+                be fetched, instead of raising it. Defaults to False.
+
+        Yields:
+            Tuples of podcast id and podcast.
+
+        """
+        async for (podcast_id,), result in self._iter_bulk(
+            self.get_podcast,
+            [(podcast_id,) for podcast_id in podcast_ids],
+            concurrency,
+            return_exceptions=return_exceptions,
+        ):
+            yield podcast_id, result
+
+    @cache(ignore=(0,), tags=_podcast_tags)
     async def get_podcast_season(self, podcast_id: str, season_id: str) -> Season:
         """Get podcast season.
 
@@ -509,7 +1128,7 @@ class NrkPodcastAPI:
         result = await self._request(f"radio/catalog/podcast/{podcast_id}/seasons/{season_id}")
         return Season.from_dict(result)
 
-    @cache(ignore=(0,))
+    @cache(ignore=(0,), tags=_podcast_tags)
     async def get_podcast_episodes(
         self,
         podcast_id: str,
@@ -548,6 +1167,32 @@ class NrkPodcastAPI:
 
         return [Episode.from_dict(e) for e in result]
 
+    async def iter_podcast_episodes(
+        self,
+        podcast_id: str,
+        season_id: str | None = None,
+        *,
+        page_size: int | None = None,
+    ) -> AsyncIterator[Episode]:
+        """Iterate over all podcast episodes, one page at a time.
+
+        The next page is fetched while the episodes of the current page are consumed.
+
+        Args:
+            podcast_id(str): Podcast ID
+            season_id(str, optional): Season ID
+            page_size(int, optional): Number of episodes to fetch per page (defaults to 50)
+
+        """
+        if season_id is not None:
+            uri = f"radio/catalog/podcast/{podcast_id}/seasons/{season_id}/episodes"
+        else:
+            uri = f"radio/catalog/podcast/{podcast_id}/episodes"
+
+        async for data in self._iter_pages(partial(self._request_paged, uri, page_size=page_size)):
+            for e in get_nested_items(data, "_embedded.episodes"):
+                yield Episode.from_dict(e)
+
     @cache(ignore=(0,))
     async def get_all_podcasts(self) -> list[SeriesListItem]:
         """Get all podcasts."""
@@ -559,7 +1204,7 @@ class NrkPodcastAPI:
         )
         return [SeriesListItem.from_dict(s) for s in result["series"]]
 
-    @cache(ignore=(0,))
+    @cache(ignore=(0,), tags=_series_tags)
     async def get_series(self, series_id: str) -> Podcast:
         """Get series.
 
@@ -685,6 +1330,44 @@ class NrkPodcastAPI:
         )
         return CategoriesResponse.from_dict(result)
 
+    async def iter_browse(
+        self,
+        letter: SingleLetter | str | None = None,
+        category: str | None = None,
+        per_page: int = 50,
+    ) -> AsyncIterator[SeriesListItem]:
+        """Iterate over all series, podcast and umbrella seasons, optionally filtered by category.
+
+        Same listing as :meth:`browse`, but follows the pagination and yields the items as
+        each page arrives. The next page is fetched while the current one is consumed.
+
+        Args:
+            category(str, optional): Category. Defaults to None, which will list all.
+            letter(SingleLetter, optional): A single letter.
+            per_page(int, optional): Number of items to fetch per page. Defaults to 50.
+
+        """
+
+        if category is None:
+            category = "alt-innhold"
+
+        async def fetch_page(page: int):
+            return await self._request(
+                f"radio/search/categories/{category}",
+                params={
+                    "letter": letter,
+                    "take": per_page,
+                    "skip": (page - 1) * per_page,
+                },
+            )
+
+        def has_next_page(data: dict) -> bool:
+            return bool(data.get("series")) and "nextPage" in data.get("_links", {})
+
+        async for data in self._iter_pages(fetch_page, has_next_page):
+            for s in data["series"]:
+                yield SeriesListItem.from_dict(s)
+
     async def search(
         self,
         query: str,
@@ -781,8 +1464,11 @@ class NrkPodcastAPI:
 
     @cache(ignore=(0,))
     async def fetch_file_info(self, url: URL | str) -> FetchedFileInfo:
-        """Proxies call to :func:`.utils.fetch_file_info`, passing on :attr:`~.NrkPodcastAPI.session`."""
-        return await fetch_file_info(url, self.session)
+        """Proxies call to :func:`.utils.fetch_file_info`, passing on :attr:`~.NrkPodcastAPI.session`.
+
+        The session is created on the shared connection pool if not set.
+        """
+        return await fetch_file_info(url, self._get_session())
 
     @cache(ignore=(0,))
     async def generate_tiled_images(
@@ -793,17 +1479,30 @@ class NrkPodcastAPI:
         aspect_ratio: str | None = None,
     ) -> bytes:  # pragma: no cover
         """Proxies call to :func:`.utils.tiled_images`, passing on :attr:`~.session`."""
-        return await tiled_images(image_urls, tile_size, columns, aspect_ratio, session=self.session)
+        return await tiled_images(image_urls, tile_size, columns, aspect_ratio, session=self._get_session())
 
     async def close(self) -> None:
-        """Close open client session."""
+        """Close open client session and connection pool, stop culling the cache and store queued writes."""
+        if self._cull_task is not None:
+            self._cull_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._cull_task
+            self._cull_task = None
+        await flush_cache_writes()
         if self.session and self._close_session:
             await self.session.close()
+        if self.connector is not None and self.auth_client.connector is self.connector:
+            await self.auth_client.close()
+        if self.connector and self._close_connector:
+            await self.connector.close()
         if not self.disable_credentials_storage:
             await self.save_credentials()
 
     async def __aenter__(self):
         """Async enter."""
+        if self.session is None:
+            self._get_connector()
+        self._start_cache_culling()
         if not self.disable_credentials_storage:
             await self.load_credentials()
         return self
@@ -7,6 +7,7 @@ from http import HTTPStatus
 from urllib.parse import quote_plus
 
 from aiohttp.client import ClientError, ClientResponse, ClientResponseError, ClientSession, ClientTimeout
+from aiohttp.connector import BaseConnector  # noqa: TCH002
 import scrypt
 from yarl import URL
 
@@ -39,6 +40,8 @@ class NrkAuthClient:
 
     request_timeout: int = 15
     session: ClientSession | None = None
+    connector: BaseConnector | None = None
+    """Optional connection pool to create the session on, e.g. the one shared by :class:`~.NrkPodcastAPI`."""
 
     credentials: NrkAuthCredentials | None = None
     login_details: NrkUserLoginDetails | None = None
@@ -103,7 +106,11 @@ class NrkAuthClient:
     def setup_session(self):
         if self.session is None:
             timeout = ClientTimeout(total=self.request_timeout)
-            self.session = ClientSession(timeout=timeout)
+            self.session = ClientSession(
+                timeout=timeout,
+                connector=self.connector,
+                connector_owner=self.connector is None,
+            )
             _LOGGER.debug("New session created.")
             self._close_session = True
 
@@ -0,0 +1,479 @@
+"""Backends of the shared cache behind the :func:`~nrk_psapi.caching.cache` decorator.
+
+The disk backends are diskcache caches, local to a host. :class:`RedisBackend` stores entries in any
+server speaking the Redis protocol, so a fleet of API nodes can share one cache, and
+:class:`MemoryBackend` keeps them in process, e.g. as a stand-in for tests.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import contextlib
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Protocol, TypeVar, runtime_checkable
+
+from diskcache import Cache, FanoutCache
+from diskcache.core import ENOVAL
+
+from .codec import CodecError, decode, encode
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+T = TypeVar("T")
+
+_SCAN_BATCH_SIZE = 1000
+_PTTL_MISSING = -2
+_PTTL_PERSISTENT = -1
+
+
+def _has_prefix(key: Hashable, prefix: str) -> bool:
+    """Check if a cache key is of a cached function with a name starting with `prefix`."""
+    return isinstance(key, tuple) and bool(key) and isinstance(key[0], str) and key[0].startswith(prefix)
+
+
+def _escape_glob(pattern: str) -> str:
+    """Escape the special characters of a Redis glob-style pattern."""
+    return re.sub(r"([\\*?\[\]])", r"\\\1", pattern)
+
+
+def _get_set_expire(expire: float | None, found: bool, expire_time: float | None) -> float | None:
+    """Time in seconds before a set expires, the longest of `expire` and the expire time it already has."""
+    if expire is None or (found and expire_time is None):
+        return None
+    return max(expire, expire_time - time.time()) if found else expire
+
+
+def _add_to_sets(cache: Cache, updates: Iterable[tuple[Hashable, Iterable[Hashable], float | None]]) -> None:
+    with cache.transact(retry=True):
+        for key, members, expire in updates:
+            value, expire_time = cache.get(key, default=ENOVAL, expire_time=True, retry=True)
+            found = value is not ENOVAL
+            value = value if found else set()
+            value.update(members)
+            cache.set(key, value, expire=_get_set_expire(expire, found, expire_time), retry=True)
+
+
+def _pop_set(cache: Cache, key: Hashable) -> set[Hashable]:
+    return cache.pop(key, default=set(), retry=True)
+
+
+def _delete_prefix(cache: Cache, prefix: str) -> int:
+    keys = [key for key in cache.iterkeys() if _has_prefix(key, prefix)]
+    with cache.transact(retry=True):
+        return sum(cache.delete(key, retry=True) for key in keys)
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """Interface of the shared cache, modelled after :class:`diskcache.Cache`.
+
+    Methods are blocking, and are called from the dedicated cache executor, see
+    :func:`~nrk_psapi.caching.run_in_cache_executor`. They must be thread-safe, as the executor
+    runs several calls at once. The `retry` arguments are only meaningful to the disk backends,
+    and ignored by others.
+    """
+
+    def get(self, key: Hashable, default: Any = None, expire_time: bool = False, retry: bool = False) -> Any:
+        """Retrieve value from cache. If `key` is missing or expired, return `default`.
+
+        If `expire_time` is True, a tuple of the value and its expire time is returned.
+        """
+
+    def set(self, key: Hashable, value: Any, expire: float | None = None, retry: bool = False) -> bool:
+        """Set `key` to `value`, expiring after `expire` seconds."""
+
+    def delete(self, key: Hashable, retry: bool = False) -> bool:
+        """Delete `key` from cache."""
+
+    def get_many(self, keys: Iterable[Hashable]) -> dict[Hashable, tuple[Any, float | None]]:
+        """Retrieve many keys at once, as tuples of the value and its expire time.
+
+        Missing keys are left out.
+        """
+
+    def set_many(self, entries: Iterable[tuple[Hashable, Any, float | None]]) -> None:
+        """Store many `(key, value, expire)` entries at once."""
+
+    def add_to_sets(self, updates: Iterable[tuple[Hashable, Iterable[Hashable], float | None]]) -> None:
+        """Add members to many sets at once, e.g. the keys of the entries with a tag, as `(key, members, expire)`.
+
+        Sets expire after the longer of `expire` and the time they already expire after, never if either is None.
+        """
+
+    def pop_set(self, key: Hashable) -> set[Hashable]:
+        """Remove the set stored under `key`, returning its members."""
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete the entries of cached functions with a name starting with `prefix`, returning the number
+        of entries removed.
+        """
+
+    def expire(self, retry: bool = False) -> int:
+        """Remove expired entries, returning the number of entries removed."""
+
+    def cull(self, retry: bool = False) -> int:
+        """Remove expired entries, and evict entries while above the size limit of the cache."""
+
+    def clear(self, retry: bool = False) -> int:
+        """Remove all entries, returning the number of entries removed."""
+
+    def __len__(self) -> int:
+        """Return the number of entries in the cache."""
+
+
+class DiskBackend(Cache):
+    """Cache on disk, in a single SQLite database."""
+
+    def get_many(self, keys: Iterable[Hashable]) -> dict[Hashable, tuple[Any, float | None]]:
+        """Retrieve many keys in a single transaction."""
+        with self.transact(retry=True):
+            entries = {key: self.get(key, default=ENOVAL, expire_time=True, retry=True) for key in keys}
+        return {key: entry for key, entry in entries.items() if entry[0] is not ENOVAL}
+
+    def set_many(self, entries: Iterable[tuple[Hashable, Any, float | None]]) -> None:
+        """Store many `(key, value, expire)` entries in a single transaction."""
+        with self.transact(retry=True):
+            for key, value, expire in entries:
+                self.set(key, value, expire=expire, retry=True)
+
+    def add_to_sets(self, updates: Iterable[tuple[Hashable, Iterable[Hashable], float | None]]) -> None:
+        """Add members to many sets, in a single transaction."""
+        _add_to_sets(self, updates)
+
+    def pop_set(self, key: Hashable) -> set[Hashable]:
+        """Remove the set stored under `key`, returning its members."""
+        return _pop_set(self, key)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete the entries of cached functions with a name starting with `prefix`."""
+        return _delete_prefix(self, prefix)
+
+
+class ShardedDiskBackend(FanoutCache):
+    """Cache on disk, sharded into a number of SQLite databases keyed by hash.
+
+    Transactions on a sharded cache lock every shard, so batches are done in a transaction per shard.
+    """
+
+    def _group_by_shard(
+        self, items: Iterable[T], get_key: Callable[[T], Hashable]
+    ) -> list[tuple[Cache, list[T]]]:
+        groups: dict[int, list[T]] = {}
+        for item in items:
+            groups.setdefault(self._hash(get_key(item)) % self._count, []).append(item)
+        return [(self._shards[index], group) for index, group in groups.items()]
+
+    def get_many(self, keys: Iterable[Hashable]) -> dict[Hashable, tuple[Any, float | None]]:
+        """Retrieve many keys, in a transaction per shard."""
+        entries = {}
+        for shard, shard_keys in self._group_by_shard(keys, lambda key: key):
+            with shard.transact(retry=True):
+                for key in shard_keys:
+                    entries[key] = shard.get(key, default=ENOVAL, expire_time=True, retry=True)
+        return {key: entry for key, entry in entries.items() if entry[0] is not ENOVAL}
+
+    def set_many(self, entries: Iterable[tuple[Hashable, Any, float | None]]) -> None:
+        """Store many `(key, value, expire)` entries, in a transaction per shard."""
+        for shard, shard_entries in self._group_by_shard(entries, lambda entry: entry[0]):
+            with shard.transact(retry=True):
+                for key, value, expire in shard_entries:
+                    shard.set(key, value, expire=expire, retry=True)
+
+    def add_to_sets(self, updates: Iterable[tuple[Hashable, Iterable[Hashable], float | None]]) -> None:
+        """Add members to many sets, in a transaction per shard."""
+        for shard, shard_updates in self._group_by_shard(updates, lambda update: update[0]):
+            _add_to_sets(shard, shard_updates)
+
+    def pop_set(self, key: Hashable) -> set[Hashable]:
+        """Remove the set stored under `key`, returning its members."""
+        return _pop_set(self._shards[self._hash(key) % self._count], key)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete the entries of cached functions with a name starting with `prefix`, shard by shard."""
+        return sum(_delete_prefix(shard, prefix) for shard in self._shards)
+
+
+class MemoryBackend:
+    """Cache in process memory.
+
+    Values are stored encoded, like in the other backends, so cached results aren't shared
+    between callers, and values that can't be stored elsewhere fail here too.
+
+    Args:
+        max_entries: Maximum number of entries, evicting the least recently used. None for no limit.
+
+    """
+
+    def __init__(self, max_entries: int | None = None):
+        self.max_entries = max_entries
+        self._data: OrderedDict[Hashable, tuple[bytes, float | None]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(
+        self,
+        key: Hashable,
+        default: Any = None,
+        expire_time: bool = False,
+        retry: bool = False,  # noqa: ARG002
+    ) -> Any:
+        """Retrieve value from cache. If `key` is missing, expired or can't be decoded, return `default`."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[1] is not None and entry[1] <= time.time():
+                del self._data[key]
+                entry = None
+            if entry is not None:
+                self._data.move_to_end(key)
+        if entry is None:
+            return (default, None) if expire_time else default
+        try:
+            value = decode(entry[0])
+        except CodecError:
+            return (default, None) if expire_time else default
+        return (value, entry[1]) if expire_time else value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        expire: float | None = None,
+        retry: bool = False,  # noqa: ARG002
+    ) -> bool:
+        """Set `key` to `value`, expiring after `expire` seconds."""
+        data = encode(value)
+        with self._lock:
+            self._data[key] = (data, None if expire is None else time.time() + expire)
+            self._data.move_to_end(key)
+            while self.max_entries is not None and len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+        return True
+
+    def delete(self, key: Hashable, retry: bool = False) -> bool:  # noqa: ARG002
+        """Delete `key` from cache."""
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def get_many(self, keys: Iterable[Hashable]) -> dict[Hashable, tuple[Any, float | None]]:
+        """Retrieve many keys at once."""
+        entries = {key: self.get(key, default=ENOVAL, expire_time=True) for key in keys}
+        return {key: entry for key, entry in entries.items() if entry[0] is not ENOVAL}
+
+    def set_many(self, entries: Iterable[tuple[Hashable, Any, float | None]]) -> None:
+        """Store many `(key, value, expire)` entries at once."""
+        for key, value, expire in entries:
+            self.set(key, value, expire)
+
+    def expire(self, retry: bool = False) -> int:  # noqa: ARG002
+        """Remove expired entries."""
+        now = time.time()
+        with self._lock:
+            expired = [
+                key
+                for key, (_, expire_time) in self._data.items()
+                if expire_time is not None and expire_time <= now
+            ]
+            for key in expired:
+                del self._data[key]
+        return len(expired)
+
+    def add_to_sets(self, updates: Iterable[tuple[Hashable, Iterable[Hashable], float | None]]) -> None:
+        """Add members to many sets at once."""
+        with self._lock:
+            for key, members, expire in updates:
+                value, expire_time = self.get(key, default=ENOVAL, expire_time=True)
+                found = value is not ENOVAL
+                value = value if found else set()
+                value.update(members)
+                self.set(key, value, _get_set_expire(expire, found, expire_time))
+
+    def pop_set(self, key: Hashable) -> set[Hashable]:
+        """Remove the set stored under `key`, returning its members."""
+        with self._lock:
+            value = self.get(key, default=set())
+            self.delete(key)
+        return value
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete the entries of cached functions with a name starting with `prefix`."""
+        with self._lock:
+            keys = [key for key in self._data if _has_prefix(key, prefix)]
+            for key in keys:
+                del self._data[key]
+        return len(keys)
+
+    def cull(self, retry: bool = False) -> int:
+        """Remove expired entries, the number of entries is bounded on every write."""
+        return self.expire(retry)
+
+    def clear(self, retry: bool = False) -> int:  # noqa: ARG002
+        """Remove all entries."""
+        with self._lock:
+            count = len(self._data)
+            self._data.clear()
+        return count
+
+
+class RedisBackend:
+    """Cache in a server speaking the Redis protocol, e.g. Redis, Valkey or KeyDB.
+
+    Entries expire by the TTL of their keys, and are evicted by the `maxmemory-policy` of the server,
+    so culling is left to the server. Requires the `redis` package (the `redis` extra), unless a
+    client is given.
+
+    Entries are pickled (see :mod:`nrk_psapi.codec`), and unpickling runs code, so the server must
+    be trusted: anyone who can write to its database can run code on every node reading from it.
+    Use a server and database dedicated to trusted nodes, with authentication, and TLS across hosts.
+
+    Args:
+        url: URL of the server, e.g. `redis://localhost:6379/0`.
+        client: Client to use instead of connecting to `url`, with the API of :class:`redis.Redis`
+            (e.g. a `fakeredis` client for tests).
+        prefix: Prefix of the keys of the cache entries, to share a database with other data.
+
+    """
+
+    def __init__(self, url: str = "redis://localhost:6379/0", client: Any = None, prefix: str = "nrk-psapi:"):
+        if client is None:
+            try:
+                import redis
+            except ImportError as err:  # pragma: no cover
+                raise ImportError(
+                    "RedisBackend requires the redis package, install it with `pip install nrk-psapi[redis]`"
+                ) from err
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.client.scan_iter(match=f"{self.prefix}*"))
+
+    def _key(self, key: Hashable) -> str:
+        return f"{self.prefix}{key!r}"
+
+    @staticmethod
+    def _entry(data: bytes | None, ttl: int) -> tuple[Any, float | None]:
+        if data is None:
+            return ENOVAL, None
+        try:
+            value = decode(data)
+        except CodecError:
+            return ENOVAL, None
+        return value, None if ttl < 0 else time.time() + ttl / 1000
+
+    def get(
+        self,
+        key: Hashable,
+        default: Any = None,
+        expire_time: bool = False,
+        retry: bool = False,  # noqa: ARG002
+    ) -> Any:
+        """Retrieve value from cache. If `key` is missing, expired or can't be decoded, return `default`."""
+        pipe = self.client.pipeline(transaction=False)
+        pipe.get(self._key(key))
+        pipe.pttl(self._key(key))
+        value, db_expire_time = self._entry(*pipe.execute())
+        if value is ENOVAL:
+            value = default
+        return (value, db_expire_time) if expire_time else value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        expire: float | None = None,
+        retry: bool = False,  # noqa: ARG002
+    ) -> bool:
+        """Set `key` to `value`, expiring after `expire` seconds."""
+        px = None if expire is None else max(int(expire * 1000), 1)
+        return bool(self.client.set(self._key(key), encode(value), px=px))
+
+    def delete(self, key: Hashable, retry: bool = False) -> bool:  # noqa: ARG002
+        """Delete `key` from cache."""
+        return bool(self.client.delete(self._key(key)))
+
+    def get_many(self, keys: Iterable[Hashable]) -> dict[Hashable, tuple[Any, float | None]]:
+        """Retrieve many keys in a single round trip."""
+        keys = list(keys)
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipe.get(self._key(key))
+            pipe.pttl(self._key(key))
+        results = pipe.execute()
+        entries = {key: self._entry(results[2 * i], results[2 * i + 1]) for i, key in enumerate(keys)}
+        return {key: entry for key, entry in entries.items() if entry[0] is not ENOVAL}
+
+    def set_many(self, entries: Iterable[tuple[Hashable, Any, float | None]]) -> None:
+        """Store many `(key, value, expire)` entries in a single round trip."""
+        pipe = self.client.pipeline(transaction=False)
+        for key, value, expire in entries:
+            pipe.set(self._key(key), encode(value), px=None if expire is None else max(int(expire * 1000), 1))
+        pipe.execute()
+
+    def add_to_sets(self, updates: Iterable[tuple[Hashable, Iterable[Hashable], float | None]]) -> None:
+        """Add members to many sets, in two round trips."""
+        updates = [(self._key(key), list(members), expire) for key, members, expire in updates]
+        pipe = self.client.pipeline(transaction=False)
+        for key, _, _ in updates:
+            pipe.pttl(key)
+        ttls = pipe.execute()
+        pipe = self.client.pipeline(transaction=True)
+        for (key, members, expire), ttl in zip(updates, ttls, strict=True):
+            if members:
+                pipe.sadd(key, *(encode(member) for member in members))
+            expire_time = None if ttl == _PTTL_PERSISTENT else time.time() + ttl / 1000
+            set_expire = _get_set_expire(expire, ttl != _PTTL_MISSING, expire_time)
+            if set_expire is None:
+                pipe.persist(key)
+            else:
+                pipe.pexpire(key, max(int(set_expire * 1000), 1))
+        pipe.execute()
+
+    def pop_set(self, key: Hashable) -> set[Hashable]:
+        """Remove the set stored under `key`, returning its members.
+
+        Members that can't be decoded are left out.
+        """
+        pipe = self.client.pipeline(transaction=True)
+        pipe.smembers(self._key(key))
+        pipe.delete(self._key(key))
+        members, _ = pipe.execute()
+        result = set()
+        for member in members:
+            with contextlib.suppress(CodecError):
+                result.add(decode(member))
+        return result
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete the entries of cached functions with a name starting with `prefix`."""
+        # Keys are stored by their repr, starting with the name of the cached function
+        return self._delete_matching(f"{_escape_glob(self.prefix)}('{_escape_glob(prefix)}*")
+
+    def expire(self, retry: bool = False) -> int:  # noqa: ARG002
+        """Expired entries are removed by the server."""
+        return 0
+
+    def cull(self, retry: bool = False) -> int:  # noqa: ARG002
+        """Expired entries are removed, and entries evicted, by the server."""
+        return 0
+
+    def clear(self, retry: bool = False) -> int:  # noqa: ARG002
+        """Remove all entries with the key prefix of the cache."""
+        return self._delete_matching(f"{_escape_glob(self.prefix)}*")
+
+    def _delete_matching(self, pattern: str) -> int:
+        count = 0
+        batch = []
+        for name in self.client.scan_iter(match=pattern, count=_SCAN_BATCH_SIZE):
+            batch.append(name)
+            if len(batch) >= _SCAN_BATCH_SIZE:
+                count += self.client.delete(*batch)
+                batch.clear()
+        if batch:
+            count += self.client.delete(*batch)
+        return count
@@ -1,20 +1,66 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import contextlib
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass
 from functools import lru_cache, partial, wraps
+import inspect
 import os
-from typing import Callable
+import sqlite3
+import time
+from typing import TYPE_CHECKING, Any, Callable, Hashable, TypeVar
+import weakref
 
 import cloudpickle
-from diskcache import Cache, Disk
-from diskcache.core import ENOVAL, UNKNOWN, args_to_key, full_name
+from diskcache import Cache, Disk, FanoutCache
+from diskcache.core import ENOVAL, EVICTION_POLICY, UNKNOWN, args_to_key, full_name
 from platformdirs import user_cache_dir
 
-from .const import DISK_CACHE_DURATION, LOGGER as _LOGGER
+from .cache_backends import CacheBackend, DiskBackend, ShardedDiskBackend, _has_prefix
+from .codec import CodecError, decode, encode
+from .const import (
+    CACHE_EXECUTOR_MAX_WORKERS,
+    DISK_CACHE_DURATION,
+    DISK_CACHE_DURATION_LONG,
+    LOGGER as _LOGGER,
+    MEMORY_CACHE_MAX_ENTRIES,
+)
+from .exceptions import NrkPsApiConnectionError
+from .utils import parse_cache_headers
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine, Iterable, Mapping
 
 _caching_enabled = os.environ.get("NRK_PSAPI_CACHE_ENABLE", "").lower() not in ("false", "0", "no")
 _caching_directory = None
+_stale_while_revalidate: float | None = None
+_ttl_policies: dict[str, float | None] = {}
+_ttl_from_headers = False
+_raw_responses = False
+_size_limit: int | None = None
+_eviction_policy = "least-recently-stored"
+_cache_shards: int | None = None
+_cache_backend: CacheBackend | None = None
+_write_behind = False
+_executor: ThreadPoolExecutor | None = None
+_executor_max_workers = CACHE_EXECUTOR_MAX_WORKERS
+_raw_response_call: ContextVar[tuple[float | None, list[Hashable]] | None] = ContextVar(
+    "_raw_response_call", default=None
+)
+_response_ttls: ContextVar[list[float] | None] = ContextVar("_response_ttls", default=None)
+_cached_call: ContextVar[bool] = ContextVar("_cached_call", default=False)
+_write_batch: ContextVar[CacheWriteBatch | None] = ContextVar("_write_batch", default=None)
+_REFRESH = object()
+T = TypeVar("T")
+_VALIDATED_RESPONSE = "nrk_psapi.caching.ValidatedResponse"
+_RAW_RESPONSE = "nrk_psapi.caching.RawResponse"
+_TAG = "nrk_psapi.caching.Tag"
+_TAG_HIERARCHY = ("podcast", "series", "season", "episode")
+"""Entity tags, from the broadest to the narrowest. Invalidating a tag also invalidates the narrower
+tags of the same entries, e.g. the episodes of a podcast."""
 
 
 class CloudpickleDisk(Disk):  # pragma: no cover
@@ -42,9 +88,453 @@ class CloudpickleDisk(Disk):  # pragma: no cover
         return data
 
 
+class UndecodableEntryError(OSError):
+    """Raised for cache entries that can't be decoded, which diskcache treats as missing."""
+
+
+class CodecDisk(CloudpickleDisk):  # pragma: no cover
+    """Disk storing values with the typed codec of :mod:`nrk_psapi.codec`.
+
+    Entries that fail to decode, e.g. because a model they contain has changed, are cache misses.
+    """
+
+    def store(self, value, read, key=UNKNOWN):
+        if not read:
+            value = encode(value, self.compress_level)
+        return Disk.store(self, value, read, key=key)
+
+    def fetch(self, mode, filename, value, read):
+        data = Disk.fetch(self, mode, filename, value, read)
+        if not read:
+            try:
+                data = decode(data)
+            except CodecError as err:
+                raise UndecodableEntryError(str(err)) from err
+        return data
+
+
+class MemoryCache:
+    """Bounded in-process LRU cache with per-entry expiry.
+
+    Sits in front of the disk cache, so hot entries are served without leaving the event loop.
+    Note that cached objects are shared between callers, and should not be mutated.
+
+    Args:
+        max_entries: Maximum number of entries, None for no limit.
+        max_size: Maximum total size in bytes (as pickled), None for no limit.
+
+    """
+
+    def __init__(self, max_entries: int | None = MEMORY_CACHE_MAX_ENTRIES, max_size: int | None = None):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self._data: OrderedDict[Hashable, tuple[Any, float | None, int]] = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the cached entries, if :attr:`max_size` is set."""
+        return self._size
+
+    def get(self, key: Hashable, default: Any = None, expire_time: bool = False) -> Any:
+        """Retrieve value from cache. If `key` is missing or expired, return `default`.
+
+        If `expire_time` is True, a tuple of the value and its expire time is returned.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return (default, None) if expire_time else default
+        value, db_expire_time, _ = entry
+        if db_expire_time is not None and db_expire_time <= time.time():
+            self.delete(key)
+            return (default, None) if expire_time else default
+        self._data.move_to_end(key)
+        return (value, db_expire_time) if expire_time else value
+
+    def set(self, key: Hashable, value: Any, expire: float | None = None) -> bool:
+        """Set `key` to `value`, expiring after `expire` seconds. Returns False if the value is not stored."""
+        if self.max_entries == 0:
+            return False
+        size = len(cloudpickle.dumps(value)) if self.max_size is not None else 0
+        if self.max_size is not None and size > self.max_size:
+            self.delete(key)
+            return False
+        self.delete(key)
+        self._data[key] = (value, None if expire is None else time.time() + expire, size)
+        self._size += size
+        self.cull()
+        return True
+
+    def delete(self, key: Hashable) -> bool:
+        """Delete `key` from cache."""
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return False
+        self._size -= entry[2]
+        return True
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Delete the entries of cached functions with a name starting with `prefix`."""
+        keys = [key for key in self._data if _has_prefix(key, prefix)]
+        for key in keys:
+            self.delete(key)
+        return len(keys)
+
+    def cull(self) -> None:
+        """Evict the least recently used entries until the cache is within its limits."""
+        while self._data and (
+            (self.max_entries is not None and len(self._data) > self.max_entries)
+            or (self.max_size is not None and self._size > self.max_size)
+        ):
+            _, (_, _, size) = self._data.popitem(last=False)
+            self._size -= size
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+        self._size = 0
+
+
+_memory_cache = MemoryCache()
+_in_flight: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Hashable, asyncio.Future]] = (
+    weakref.WeakKeyDictionary()
+)
+_write_behind_queues: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _WriteBehindQueue] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_memory_cache() -> MemoryCache:
+    """Get the in-process cache that sits in front of the disk cache."""
+    return _memory_cache
+
+
+def set_memory_cache_limits(max_entries: int | None = MEMORY_CACHE_MAX_ENTRIES, max_size: int | None = None):
+    """Set the limits of the in-process cache.
+
+    Args:
+        max_entries: Maximum number of entries, None for no limit, 0 to disable the in-process cache.
+        max_size: Maximum total size in bytes, None for no limit.
+
+    """
+    if max_size != _memory_cache.max_size:
+        _memory_cache.clear()
+    _memory_cache.max_entries = max_entries
+    _memory_cache.max_size = max_size
+    _memory_cache.cull()
+    _LOGGER.debug("Memory cache limits set to %s entries, %s bytes", max_entries, max_size)
+
+
+@dataclass
+class ValidatedResponse:
+    """A parsed API response, with the validators needed to revalidate it with a conditional request."""
+
+    data: Any
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that make a request conditional on the response having changed."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def get_cache_executor() -> ThreadPoolExecutor:
+    """Get the executor running the blocking calls to the shared cache.
+
+    A dedicated executor keeps cache calls from queueing behind other work in the default executor
+    of the event loop, and bounds the number of threads hitting the cache at once.
+    """
+    global _executor  # noqa: PLW0603
+    if _executor is None:
+        _executor = ThreadPoolExecutor(_executor_max_workers, thread_name_prefix="nrk-psapi-cache")
+    return _executor
+
+
+def set_cache_executor_max_workers(max_workers: int):
+    """Set the maximum number of threads of the cache executor, see :func:`get_cache_executor`."""
+    if max_workers < 1:
+        raise ValueError(f"Maximum number of workers must be at least 1, got {max_workers}")
+    global _executor, _executor_max_workers  # noqa: PLW0603
+    if max_workers == _executor_max_workers:
+        return
+    _executor_max_workers = max_workers
+    if _executor is not None:
+        # Calls already submitted still run
+        _executor.shutdown(wait=False)
+        _executor = None
+    _LOGGER.debug("Cache executor max workers set to %s", max_workers)
+
+
+async def run_in_cache_executor(func: Callable[..., T], *args, **kwargs) -> T:  # noqa: ANN002
+    """Run a blocking call to the shared cache in the cache executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_cache_executor(), partial(func, *args, **kwargs))
+
+
+class _WriteBehindQueue:
+    """Writes of the running event loop waiting to be stored in the shared cache.
+
+    Writes queued while a batch is being stored are stored together in the next batch.
+    """
+
+    def __init__(self):
+        self.entries: list[tuple[Hashable, Any, float | None]] = []
+        self.tag_updates: list[tuple[Hashable, set, float | None]] = []
+        self.task: asyncio.Task | None = None
+
+    def add(self, key: Hashable, value: Any, expire: float | None) -> None:
+        self.entries.append((key, value, expire))
+        self.schedule()
+
+    def add_tags(self, updates: list[tuple[Hashable, set, float | None]]) -> None:
+        self.tag_updates.extend(updates)
+        self.schedule()
+
+    def schedule(self) -> None:
+        if self.task is None:
+            self.task = asyncio.ensure_future(self.run())
+
+    async def run(self) -> None:
+        try:
+            while self.entries or self.tag_updates:
+                entries, self.entries = self.entries, []
+                tag_updates, self.tag_updates = self.tag_updates, []
+                try:
+                    if entries:
+                        await cache_set_many(entries)
+                    if tag_updates:
+                        await run_in_cache_executor(_add_tags, tag_updates)
+                except Exception as err:  # noqa: BLE001
+                    _LOGGER.warning("Storing %s cache entries failed: %s", len(entries), err)
+        finally:
+            self.task = None
+
+    async def flush(self) -> None:
+        if self.task is not None:
+            await asyncio.shield(self.task)
+
+
+def _get_write_behind_queue() -> _WriteBehindQueue:
+    loop = asyncio.get_running_loop()
+    queue = _write_behind_queues.get(loop)
+    if queue is None:
+        queue = _write_behind_queues[loop] = _WriteBehindQueue()
+    return queue
+
+
+async def flush_cache_writes() -> None:
+    """Wait until the writes queued by write-behind caching are stored, see :func:`set_cache_write_behind`."""
+    if (queue := _write_behind_queues.get(asyncio.get_running_loop())) is not None:
+        await queue.flush()
+
+
+def _get_write_batch() -> CacheWriteBatch | None:
+    """Get the write batch collecting the writes of the current context, unless it is already flushed.
+
+    Loads still in flight when a batch is flushed store their results right away instead.
+    """
+    write_batch = _write_batch.get()
+    return None if write_batch is None or write_batch.flushed else write_batch
+
+
+async def _cache_set(key: Hashable, value: Any, expire: float | None) -> None:
+    """Store an entry in the shared cache, or collect it in the current write batch or write-behind queue."""
+    write_batch = _get_write_batch()
+    if write_batch is not None:
+        write_batch.entries.append((key, value, expire))
+    elif _write_behind:
+        _get_write_behind_queue().add(key, value, expire)
+    else:
+        await run_in_cache_executor(get_cache().set, key=key, value=value, expire=expire, retry=True)
+
+
+def _longest_expire(*expires: float | None) -> float | None:
+    """Get the longest of the given times in seconds before expiry, None meaning never."""
+    return None if any(expire is None for expire in expires) else max(expires)
+
+
+def _get_tag_updates(
+    keys: Iterable[Hashable],
+    tags: Mapping[str, list[str]],
+    expire: float | None,
+) -> list[tuple[Hashable, set, float | None]]:
+    """Get the members to add to the sets of tagged cache keys, by tag.
+
+    Tags of the hierarchy also get the narrower tags of the same entries as members. The sets
+    expire with the entries, after `expire` seconds.
+    """
+    updates = []
+    for name, values in tags.items():
+        members = set(keys)
+        if name in _TAG_HIERARCHY:
+            members.update(
+                (_TAG, child, value)
+                for child, child_values in tags.items()
+                if child in _TAG_HIERARCHY and _TAG_HIERARCHY.index(child) > _TAG_HIERARCHY.index(name)
+                for value in child_values
+            )
+        updates.extend(((_TAG, name, value), members, expire) for value in values)
+    return updates
+
+
+def _add_tags(updates: Iterable[tuple[Hashable, set, float | None]]) -> None:
+    """Add tag updates to the shared cache at once, merging the updates of the same tag."""
+    merged: dict[Hashable, tuple[set, float | None]] = {}
+    for tag_key, members, expire in updates:
+        if tag_key in merged:
+            merged_members, merged_expire = merged[tag_key]
+            merged_members.update(members)
+            merged[tag_key] = (merged_members, _longest_expire(merged_expire, expire))
+        else:
+            merged[tag_key] = (set(members), expire)
+    get_cache().add_to_sets([(tag_key, members, expire) for tag_key, (members, expire) in merged.items()])
+
+
+async def _cache_tag(keys: Iterable[Hashable], tags: Mapping[str, list[str]], expire: float | None) -> None:
+    """Tag cache entries expiring after `expire` seconds, or collect the tags in the current write batch
+    or write-behind queue.
+    """
+    updates = _get_tag_updates(keys, tags, expire)
+    write_batch = _get_write_batch()
+    if write_batch is not None:
+        write_batch.tag_updates.extend(updates)
+    elif _write_behind:
+        _get_write_behind_queue().add_tags(updates)
+    else:
+        await run_in_cache_executor(_add_tags, updates)
+
+
+async def get_validated_response(url: str) -> ValidatedResponse | None:
+    """Get the stored response for a URL, to revalidate with a conditional request.
+
+    Only looked up within calls of cached functions, whose results are worth revalidating.
+    """
+    if not _caching_enabled or not _cached_call.get():
+        return None
+    return await run_in_cache_executor(get_cache().get, key=(_VALIDATED_RESPONSE, url), retry=True)
+
+
+async def set_validated_response(url: str, response: ValidatedResponse) -> None:
+    """Store a response for a URL, if it has validators to make conditional requests with.
+
+    Only stored within calls of cached functions, see :func:`get_validated_response`.
+    """
+    if not _caching_enabled or not _cached_call.get():
+        return
+    if response.etag is None and response.last_modified is None:
+        return
+    await _cache_set((_VALIDATED_RESPONSE, url), response, DISK_CACHE_DURATION_LONG)
+
+
+async def get_raw_response(url: str) -> bytes | None:
+    """Get the cached raw payload of a GET request, if raw responses are cached.
+
+    Only looked up within calls of cached functions, see :func:`set_cache_raw_responses`.
+    """
+    if not _caching_enabled or not _raw_responses or _raw_response_call.get() is None:
+        return None
+    return await run_in_cache_executor(get_cache().get, key=(_RAW_RESPONSE, url), retry=True)
+
+
+async def set_raw_response(url: str, payload: bytes, headers: Mapping[str, str]) -> None:
+    """Cache the raw payload of a GET request, for the time the calling cached function caches results for."""
+    if not _caching_enabled or not _raw_responses or (raw_response_call := _raw_response_call.get()) is None:
+        return
+    expire, raw_keys = raw_response_call
+    if _ttl_from_headers and (header_ttl := parse_cache_headers(headers)) is not None:
+        expire = header_ttl
+    if expire is not None and expire <= 0:
+        return
+    raw_keys.append(((_RAW_RESPONSE, url), expire))
+    await _cache_set((_RAW_RESPONSE, url), payload, expire)
+
+
+async def cache_get_many(
+    keys: Iterable[Hashable],
+    memory: CacheBackend | None = None,
+) -> dict[Hashable, tuple[Any, float | None]]:
+    """Look up many keys in the disk cache, in a single executor call and transaction.
+
+    Returns a tuple of the value and its expire time for each key found. Missing keys are left out.
+    """
+    return await run_in_cache_executor((memory or get_cache()).get_many, list(keys))
+
+
+async def cache_set_many(
+    entries: Iterable[tuple[Hashable, Any, float | None]],
+    memory: CacheBackend | None = None,
+) -> None:
+    """Store many `(key, value, expire)` entries in the disk cache, in a single executor call and transaction."""
+    await run_in_cache_executor((memory or get_cache()).set_many, list(entries))
+
+
+class CacheWriteBatch:
+    """Collects the disk cache writes of cached functions, to store them at once.
+
+    Results are still put in the in-process cache right away, only the disk cache
+    writes are deferred until :meth:`flush` is called.
+
+    Example:
+        batch = CacheWriteBatch()
+        with batch.collect():
+            await api.get_episode(podcast_id, episode_id)
+        await batch.flush()
+
+    """
+
+    def __init__(self):
+        self.entries: list[tuple[Hashable, Any, float | None]] = []
+        self.tag_updates: list[tuple[Hashable, set, float | None]] = []
+        self.flushed = False
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @contextlib.contextmanager
+    def collect(self):
+        """Collect the writes made in the current context, e.g. the current task."""
+        self.flushed = False
+        token = _write_batch.set(self)
+        try:
+            yield self
+        finally:
+            _write_batch.reset(token)
+
+    async def flush(self) -> None:
+        """Store the collected writes in the disk cache.
+
+        Writes made after this, e.g. by loads that are still in flight, are stored right away.
+        """
+        self.flushed = True
+        entries = list(self.entries)
+        tag_updates = list(self.tag_updates)
+        self.entries.clear()
+        self.tag_updates.clear()
+        if not _caching_enabled:
+            return
+        if entries:
+            await cache_set_many(entries)
+        if tag_updates:
+            await run_in_cache_executor(_add_tags, tag_updates)
+
+
 @lru_cache(1)
-def get_cache():
-    """Get the context object that contains previously-computed return values."""
+def get_cache() -> CacheBackend:
+    """Get the context object that contains previously-computed return values.
+
+    This is the backend set by :func:`set_cache_backend`, or the disk cache.
+    """
+    if _cache_backend is not None:
+        return _cache_backend
     if _caching_directory is not None:
         cache_dir = _caching_directory
     else:
@@ -53,85 +543,372 @@ def get_cache():
         cache_dir = user_cache_dir("nrk-psapi", ensure_exists=True)
 
     _LOGGER.debug(f"get_cache(): {cache_dir}")
-    return Cache(
-        cache_dir,
-        eviction_policy="none",
-        cull_limit=0,
-        disk=CloudpickleDisk,
-    )
+    # Culling is left to cull_cache(), to keep it off the request path
+    settings = {
+        "size_limit": _size_limit or 0,
+        "eviction_policy": _eviction_policy if _size_limit else "none",
+        "cull_limit": 0,
+        "disk": CodecDisk,
+    }
+    if _cache_shards:
+        return ShardedDiskBackend(cache_dir, shards=_cache_shards, **settings)
+    return DiskBackend(cache_dir, **settings)
+
+
+async def cull_cache() -> int:
+    """Remove expired entries from the disk cache, and evict entries while it is above its size limit.
+
+    Returns the number of entries removed.
+    """
+    if not _caching_enabled:
+        return 0
+    memory = get_cache()
+    # Cache.cull() only expires entries if there is an eviction policy
+    cull = memory.cull if _size_limit else memory.expire
+    removed = await run_in_cache_executor(cull, retry=True)
+    if removed:
+        _LOGGER.debug("Culled %s entries from the cache", removed)
+    return removed
+
+
+async def run_cache_culling(interval: float) -> None:
+    """Cull the disk cache every `interval` seconds, until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await cull_cache()
+        except (OSError, sqlite3.Error) as err:
+            _LOGGER.warning("Culling the cache failed: %s", err)
+
+
+def _get_in_flight() -> dict[Hashable, asyncio.Future]:
+    """Get the in-flight cache loads of the running event loop, by cache key."""
+    loop = asyncio.get_running_loop()
+    in_flight = _in_flight.get(loop)
+    if in_flight is None:
+        in_flight = _in_flight[loop] = {}
+    return in_flight
+
+
+def _create_background_task(coro: Coroutine[Any, Any, T]) -> asyncio.Task[T]:
+    """Create a task that outlives its caller, so its writes are not collected in the write batch of the caller."""
+    context = copy_context()
+    context.run(_write_batch.set, None)
+    return asyncio.get_running_loop().create_task(coro, context=context)
+
+
+def _track_in_flight(in_flight: dict[Hashable, asyncio.Future], key: Hashable, task: asyncio.Future):
+    """Register an in-flight task, and forget it once done."""
+
+    def done(_: asyncio.Future):
+        in_flight.pop(key, None)
+        if not task.cancelled():
+            # Background refreshes may fail without anyone awaiting them
+            task.exception()
+
+    in_flight[key] = task
+    task.add_done_callback(done)
+
+
+def _remaining(expire_time: float | None) -> float | None:
+    """Seconds until the given expire time."""
+    return None if expire_time is None else max(expire_time - time.time(), 0)
+
+
+def _get_ttl(name: str, expire: float | None) -> float | None:
+    """Time in seconds before entries of the named function expire, according to the TTL policies."""
+    return _ttl_policies.get(name, expire)
+
+
+def _get_stale(expire: float | None, stale_while_revalidate: float | None) -> float | None:
+    """Time in seconds an expired entry is still served."""
+    if expire is None:
+        return None
+    return stale_while_revalidate if stale_while_revalidate is not None else _stale_while_revalidate
+
+
+def _get_store_expire(expire: float | None, stale: float | None) -> float | None:
+    """Time in seconds before an entry is removed from the cache, including the stale period.
+
+    Entries that expire right away, e.g. responses with `Cache-Control: no-store`, are not served stale.
+    """
+    if expire is not None and expire <= 0:
+        return 0
+    return expire if not stale else expire + stale
+
+
+def _is_stale(expire_time: float | None, stale: float | None) -> bool:
+    """Whether an entry with the given expire time is past its fresh period."""
+    return bool(stale) and expire_time is not None and expire_time - stale <= time.time()
+
+
+def record_response_headers(headers: Mapping[str, str]) -> None:
+    """Record the cache headers of a response, for the cached function call it is part of.
+
+    Only has an effect if TTLs are derived from response headers, see :func:`set_cache_ttl_from_headers`.
+    """
+    response_ttls = _response_ttls.get()
+    if response_ttls is not None and (ttl := parse_cache_headers(headers)) is not None:
+        response_ttls.append(ttl)
+
+
+class _AsyncCacheLoader:
+    """Loads, stores and refreshes cache entries for an async cached function."""
+
+    def __init__(
+        self,
+        cached_function: Callable,
+        name: str,
+        expire: float | None,
+        stale_while_revalidate: float | None,
+        tags: Callable[..., Mapping[str, str | Iterable[str] | None]] | None = None,
+    ):
+        self.cached_function = cached_function
+        self.name = name
+        self.expire = expire
+        self.stale_while_revalidate = stale_while_revalidate
+        self.tags = tags
+        self.signature = inspect.signature(cached_function) if tags is not None else None
+        self.wrapper: Callable | None = None
+
+    @property
+    def ttl(self) -> float | None:
+        return _get_ttl(self.cached_function.__name__, self.expire)
+
+    def get_stale(self, ttl: float | None) -> float | None:
+        return _get_stale(ttl, self.stale_while_revalidate)
+
+    def get_tags(self, result, args, kwargs) -> dict[str, list[str]]:
+        """Get the entity tags of a result, by tag name."""
+        if self.tags is None:
+            return {}
+        arguments = self.signature.bind(*args, **kwargs)
+        arguments.apply_defaults()
+        tags = self.tags(result, **arguments.arguments)
+        return {
+            name: [value] if isinstance(value, str) else list(value)
+            for name, value in tags.items()
+            if value is not None
+        }
+
+    async def call(self, *args, **kwargs):  # noqa: ANN002
+        """Call the cached function.
+
+        Returns the result, the time in seconds to cache it for and the keys and expiry of the raw
+        payloads it was built from, if raw responses are cached.
+        """
+        ttl = self.ttl
+        raw_keys = []
+        call_token = _cached_call.set(True)
+        raw_token = _raw_response_call.set((ttl, raw_keys)) if _raw_responses else None
+        try:
+            if not _ttl_from_headers:
+                return await self.cached_function(*args, **kwargs), ttl, raw_keys
+            response_ttls = []
+            token = _response_ttls.set(response_ttls)
+            try:
+                result = await self.cached_function(*args, **kwargs)
+            finally:
+                _response_ttls.reset(token)
+            return result, min(response_ttls) if response_ttls else ttl, raw_keys
+        finally:
+            if raw_token is not None:
+                _raw_response_call.reset(raw_token)
+            _cached_call.reset(call_token)
+
+    async def store(self, cache_key, result, ttl: float | None, tags=None, raw_keys=()):
+        store_expire = _get_store_expire(ttl, self.get_stale(ttl))
+        if store_expire is not None and store_expire <= 0:
+            return
+        _memory_cache.set(cache_key, result, store_expire)
+        # The raw payloads are cached on disk instead of results built from them, if raw responses are cached
+        if not raw_keys:
+            await _cache_set(cache_key, result, store_expire)
+        if tags:
+            await _cache_tag(
+                [cache_key, *(raw_key for raw_key, _ in raw_keys)],
+                tags,
+                _longest_expire(store_expire, *(raw_expire for _, raw_expire in raw_keys)),
+            )
+
+    async def call_and_store(self, cache_key, *args, **kwargs):  # noqa: ANN002
+        result, ttl, raw_keys = await self.call(*args, **kwargs)
+        await self.store(cache_key, result, ttl, self.get_tags(result, args, kwargs), raw_keys)
+        return result
+
+    async def refresh(self, cache_key, *args, **kwargs):  # noqa: ANN002
+        try:
+            return await self.call_and_store(cache_key, *args, **kwargs)
+        except NrkPsApiConnectionError as err:
+            _LOGGER.warning("Refreshing %s failed, serving stale data: %s", self.name, err)
+            raise
+
+    def schedule_refresh(self, cache_key, args, kwargs):
+        in_flight = _get_in_flight()
+        refresh_key = (_REFRESH, cache_key)
+        if refresh_key not in in_flight:
+            task = _create_background_task(self.refresh(cache_key, *args, **kwargs))
+            _track_in_flight(in_flight, refresh_key, task)
+
+    async def get_many(self, calls: Iterable[tuple]) -> dict[int, Any]:
+        """Look up the cached results of many calls at once, by their position in `calls`.
+
+        Entries missing from the memory tier are read from the disk cache in a single executor
+        call and transaction. Missing and stale entries are left out, so callers load them the usual way.
+        """
+        if not _caching_enabled:
+            return {}
+        stale = self.get_stale(self.ttl)
+        results = {}
+        disk_keys = {}
+        for index, args in enumerate(calls):
+            cache_key = self.wrapper.__cache_key__(*args)
+            result, expire_time = _memory_cache.get(cache_key, default=ENOVAL, expire_time=True)
+            if result is ENOVAL:
+                disk_keys[index] = cache_key
+            elif not _is_stale(expire_time, stale):
+                results[index] = result
+        if not disk_keys:
+            return results
+
+        entries = await cache_get_many(disk_keys.values())
+        for index, cache_key in disk_keys.items():
+            if cache_key not in entries:
+                continue
+            result, expire_time = entries[cache_key]
+            _memory_cache.set(cache_key, result, _remaining(expire_time))
+            if not _is_stale(expire_time, stale):
+                results[index] = result
+        return results
+
+    async def load(self, cache_key, stale: float | None, *args, **kwargs):  # noqa: ANN002
+        result, expire_time = await run_in_cache_executor(
+            get_cache().get,
+            key=cache_key,
+            default=ENOVAL,
+            expire_time=True,
+            retry=True,
+        )
+
+        if result is ENOVAL:
+            return await self.call_and_store(cache_key, *args, **kwargs)
+
+        _memory_cache.set(cache_key, result, _remaining(expire_time))
+        if _is_stale(expire_time, stale):
+            self.schedule_refresh(cache_key, args, kwargs)
+        return result
+
+
+def _async_cache_wrapper(
+    cached_function: Callable,
+    name: str,
+    expire: float | None,
+    stale_while_revalidate: float | None,
+    tags: Callable[..., Mapping[str, str | Iterable[str] | None]] | None = None,
+) -> Callable:
+    loader = _AsyncCacheLoader(cached_function, name, expire, stale_while_revalidate, tags)
+
+    @wraps(cached_function)
+    async def wrapper(*args, **kwargs):  # noqa: ANN002
+        if not _caching_enabled:
+            return await cached_function(*args, **kwargs)
+        cache_key = wrapper.__cache_key__(*args, **kwargs)
+        stale = loader.get_stale(loader.ttl)
+        result, expire_time = _memory_cache.get(cache_key, default=ENOVAL, expire_time=True)
+        if result is not ENOVAL:
+            if _is_stale(expire_time, stale):
+                loader.schedule_refresh(cache_key, args, kwargs)
+            return result
+
+        # Concurrent callers for the same key share a single in-flight load
+        in_flight = _get_in_flight()
+        task = in_flight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(loader.load(cache_key, stale, *args, **kwargs))
+            _track_in_flight(in_flight, cache_key, task)
+        return await asyncio.shield(task)
+
+    loader.wrapper = wrapper
+    wrapper.__cache_get_many__ = loader.get_many
+    return wrapper
+
+
+def _sync_cache_wrapper(  # pragma: no cover
+    cached_function: Callable,
+    name: str,
+    expire: float | None,
+    stale_while_revalidate: float | None,
+) -> Callable:
+    @wraps(cached_function)
+    def wrapper(*args, **kwargs):  # noqa: ANN002
+        if not _caching_enabled:
+            return cached_function(*args, **kwargs)
+
+        cache_key = wrapper.__cache_key__(*args, **kwargs)
+        ttl = _get_ttl(cached_function.__name__, expire)
+        stale = _get_stale(ttl, stale_while_revalidate)
+        result, expire_time = _memory_cache.get(cache_key, default=ENOVAL, expire_time=True)
+        if result is ENOVAL:
+            result, expire_time = get_cache().get(cache_key, default=ENOVAL, expire_time=True, retry=True)
+            if result is not ENOVAL:
+                _memory_cache.set(cache_key, result, _remaining(expire_time))
+
+        if result is not ENOVAL and not _is_stale(expire_time, stale):
+            return result
+
+        # Without an event loop to refresh in the background, stale entries are
+        # refreshed in place, and only served if the NRK API is unavailable.
+        try:
+            fresh_result = cached_function(*args, **kwargs)
+        except NrkPsApiConnectionError as err:
+            if result is ENOVAL:
+                raise
+            _LOGGER.warning("Refreshing %s failed, serving stale data: %s", name, err)
+            return result
+        store_expire = _get_store_expire(ttl, stale)
+        if store_expire is None or store_expire > 0:
+            get_cache().set(cache_key, fresh_result, store_expire, retry=True)
+            _memory_cache.set(cache_key, fresh_result, store_expire)
+        return fresh_result
+
+    return wrapper
 
 
 # noinspection PyUnusedLocal
-def cache(expire: float | None = DISK_CACHE_DURATION, typed=False, ignore=()):
+def cache(
+    expire: float | None = DISK_CACHE_DURATION,
+    typed=False,
+    ignore=(),
+    stale_while_revalidate: float | None = None,
+    tags: Callable[..., Mapping[str, str | Iterable[str] | None]] | None = None,
+):
     """Cache decorator for memoizing function calls.
 
     Args:
-        expire: Time in seconds before cache expires
+        expire: Time in seconds before cache expires, unless overridden by :func:`set_cache_ttl`
         typed: Use type information for cache key
         ignore: Positional or keyword arguments to ignore
+        stale_while_revalidate: Time in seconds an expired entry is still served, while it is
+            refreshed in the background. Defaults to the value set by :func:`set_stale_while_revalidate`.
+        tags: Function returning the entity tags of a result, by tag name, to drop the entries with
+            :func:`invalidate`. Called with the result and the arguments of the call, by name.
+            Only used for async functions.
 
     """
 
     def decorator(cached_function: Callable):
-        memory = get_cache()
-
         base = (full_name(cached_function),)
 
         if asyncio.iscoroutinefunction(cached_function):
-
-            @wraps(cached_function)
-            async def wrapper(*args, **kwargs):  # noqa: ANN002 # pragma: no cover
-                if not _caching_enabled:
-                    return await cached_function(*args, **kwargs)
-                cache_key = wrapper.__cache_key__(*args, **kwargs)
-                loop = asyncio.get_running_loop()
-                result = await loop.run_in_executor(
-                    None,
-                    partial(
-                        wrapper.__memory__.get,
-                        key=cache_key,
-                        default=ENOVAL,
-                        retry=True,
-                    ),
-                )
-
-                if result is ENOVAL:
-                    result = await cached_function(*args, **kwargs)
-                    await loop.run_in_executor(
-                        None,
-                        partial(
-                            wrapper.__memory__.set,
-                            key=cache_key,
-                            value=result,
-                            expire=expire,
-                            retry=True,
-                        ),
-                    )
-
-                return result
-
+            wrapper = _async_cache_wrapper(cached_function, base[0], expire, stale_while_revalidate, tags)
         else:  # pragma: no cover
-
-            @wraps(cached_function)
-            def wrapper(*args, **kwargs):  # noqa: ANN002
-                if not _caching_enabled:
-                    return cached_function(*args, **kwargs)
-
-                cache_key = wrapper.__cache_key__(*args, **kwargs)
-                result = wrapper.__memory__.get(cache_key, default=ENOVAL, retry=True)
-
-                if result is ENOVAL:
-                    result = cached_function(*args, **kwargs)
-                    wrapper.__memory__.set(cache_key, result, expire, retry=True)
-
-                return result
+            wrapper = _sync_cache_wrapper(cached_function, base[0], expire, stale_while_revalidate)
 
         def __cache_key__(*args, **kwargs):  # noqa: N807, ANN002  # pragma: no cover
             """Make key for cache given function arguments."""
             return args_to_key(base, args, kwargs, typed, ignore)
 
         wrapper.__cache_key__ = __cache_key__
-        wrapper.__memory__ = memory
 
         return wrapper
 
@@ -143,9 +920,131 @@ def set_cache_dir(cache_dir: str):
     global _caching_directory  # noqa: PLW0603
     _caching_directory = cache_dir
     get_cache.cache_clear()
+    _memory_cache.clear()
     _LOGGER.debug("Cache directory set to %s", cache_dir)
 
 
+def set_cache_backend(backend: CacheBackend | None):
+    """Set the backend of the shared cache behind the in-process cache, e.g. a :class:`.RedisBackend`
+    to share a cache between hosts. None to use the disk cache (default).
+    """
+    global _cache_backend  # noqa: PLW0603
+    _cache_backend = backend
+    get_cache.cache_clear()
+    _memory_cache.clear()
+    _LOGGER.debug("Cache backend set to %s", type(backend).__name__ if backend else "disk")
+
+
+def set_cache_shards(shards: int | None):
+    """Shard the disk cache into a number of SQLite databases, keyed by hash.
+
+    Spreads writes from many processes over the shards, instead of contending for the write lock of
+    a single database. Sharded entries are stored in subdirectories of the cache directory, so
+    processes sharing a cache directory must use the same number of shards.
+
+    Args:
+        shards: Number of shards, None to not shard the cache.
+
+    """
+    if shards is not None and shards < 1:
+        raise ValueError(f"Number of shards must be at least 1, got {shards}")
+    global _cache_shards  # noqa: PLW0603
+    if shards == _cache_shards:
+        return
+    _cache_shards = shards
+    get_cache.cache_clear()
+    _memory_cache.clear()
+    _LOGGER.debug("Cache shards set to %s", shards)
+
+
+def set_cache_ttl(name: str, expire: float | None):
+    """Override the time in seconds before cache entries of a cached function expire.
+
+    Args:
+        name: Name of the cached function, e.g. `get_live_channel`.
+        expire: Time in seconds before cache entries expire, None for never.
+
+    """
+    _ttl_policies[name] = expire
+    _LOGGER.debug("Cache TTL for %s set to %s", name, expire)
+
+
+def get_cache_ttl_policies() -> dict[str, float | None]:
+    """Get the cache TTL overrides, by function name."""
+    return dict(_ttl_policies)
+
+
+def set_cache_ttl_from_headers(enabled: bool):
+    """Derive the time to cache results for from the Cache-Control/Expires headers of the responses.
+
+    Falls back to the TTL of the cached function when a response has no such headers.
+    """
+    global _ttl_from_headers  # noqa: PLW0603
+    _ttl_from_headers = enabled
+    _LOGGER.debug("Cache TTL from response headers %s", "enabled" if enabled else "disabled")
+
+
+def set_cache_size_limit(size_limit: int | None, eviction_policy: str = "least-recently-stored"):
+    """Set the size limit of the disk cache.
+
+    The cache is brought below its size limit by :func:`cull_cache`, evicting entries by the
+    eviction policy. Writes don't evict entries themselves, so the cache can temporarily grow
+    beyond the limit.
+
+    Args:
+        size_limit: Size limit in bytes, None for no limit.
+        eviction_policy: Which entries to evict first, one of `least-recently-stored` (default),
+            `least-recently-used` or `least-frequently-used`. The last two record every access,
+            which costs a write per disk cache hit.
+
+    """
+    if eviction_policy not in EVICTION_POLICY or eviction_policy == "none":
+        raise ValueError(f"Unknown eviction policy: {eviction_policy}")
+    global _size_limit, _eviction_policy  # noqa: PLW0603
+    _size_limit = size_limit
+    _eviction_policy = eviction_policy
+    memory = get_cache() if get_cache.cache_info().currsize else None
+    if isinstance(memory, (Cache, FanoutCache)):
+        # The size limit of a sharded cache is split between the shards
+        memory.reset("size_limit", (size_limit or 0) // (_cache_shards or 1))
+        memory.reset("eviction_policy", eviction_policy if size_limit else "none")
+    _LOGGER.debug("Cache size limit set to %s (%s)", size_limit, eviction_policy)
+
+
+def set_cache_write_behind(enabled: bool):
+    """Store results in the shared cache in the background, without making callers wait for it.
+
+    Results are in the in-process cache right away. Writes queued while others are being stored are
+    batched. Use :func:`flush_cache_writes` to wait for the queued writes, e.g. before exiting.
+    """
+    global _write_behind  # noqa: PLW0603
+    _write_behind = enabled
+    _LOGGER.debug("Write-behind caching %s", "enabled" if enabled else "disabled")
+
+
+def set_cache_raw_responses(enabled: bool):
+    """Cache the raw payloads of the API responses on disk, instead of the results built from them.
+
+    Results are still kept in the in-process cache. Results missing from it are built again from
+    the cached payloads, without requests to the API. Results of cached functions that make no
+    API requests are cached on disk as usual.
+    """
+    global _raw_responses  # noqa: PLW0603
+    _raw_responses = enabled
+    _LOGGER.debug("Caching raw responses %s", "enabled" if enabled else "disabled")
+
+
+def set_stale_while_revalidate(seconds: float | None):
+    """Set the default time in seconds an expired entry is still served, while it is refreshed.
+
+    Stale entries are also served if refreshing fails because the NRK API is unavailable
+    or rate limited. Set to None to disable (default).
+    """
+    global _stale_while_revalidate  # noqa: PLW0603
+    _stale_while_revalidate = seconds
+    _LOGGER.debug("Stale-while-revalidate set to %s", seconds)
+
+
 def disable_cache():
     """Disable the cache for this session."""
     global _caching_enabled  # noqa: PLW0603
@@ -157,9 +1056,71 @@ def clear_cache():
     """Erase the cache completely."""
     memory = get_cache()
     memory.clear()
+    _memory_cache.clear()
     _LOGGER.debug("Cache cleared")
 
 
+def invalidate(**tags: str) -> int:
+    """Drop the cache entries tagged with any of the given entity tags.
+
+    Narrower tags of the same entries are invalidated too, so `invalidate(podcast="hele_historien")`
+    drops the podcast, its seasons and episodes, and the playback manifests of the episodes.
+    Season tags are namespaced by their podcast or series, e.g. `invalidate(season="hele_historien/2021")`.
+    Entries are only dropped from the in-process cache of the current process.
+
+    Writes queued by write-behind caching or in the current :class:`CacheWriteBatch` are dropped too.
+    Loads that are in flight, and writes that are already being stored, can still store stale
+    entries afterwards.
+
+    Returns the number of entries dropped.
+    """
+    memory = get_cache()
+    queued_writes = [*_write_behind_queues.values()]
+    if (write_batch := _get_write_batch()) is not None:
+        queued_writes.append(write_batch)
+    pending = [(_TAG, name, value) for name, value in tags.items()]
+    seen = set()
+    members_seen = set()
+    dropped = set()
+    while pending:
+        tag_key = pending.pop()
+        if tag_key in seen:
+            continue
+        seen.add(tag_key)
+        members = set(memory.pop_set(tag_key))
+        for writes in queued_writes:
+            members.update(*(queued for key, queued, _expire in writes.tag_updates if key == tag_key))
+            writes.tag_updates[:] = [update for update in writes.tag_updates if update[0] != tag_key]
+        for member in members:
+            if isinstance(member, tuple) and member[:1] == (_TAG,):
+                pending.append(member)
+                continue
+            members_seen.add(member)
+            removed = memory.delete(member, retry=True)
+            if _memory_cache.delete(member) or removed:
+                dropped.add(member)
+    for writes in queued_writes:
+        dropped.update(key for key, _value, _expire in writes.entries if key in members_seen)
+        writes.entries[:] = [entry for entry in writes.entries if entry[0] not in members_seen]
+    count = len(dropped)
+    _LOGGER.debug("Invalidated %s cache entries tagged %s", count, tags)
+    return count
+
+
+def invalidate_prefix(prefix: str) -> int:
+    """Drop the cache entries of cached functions with a full name starting with `prefix`,
+    e.g. `invalidate_prefix("nrk_psapi.api.NrkPodcastAPI.get_podcast")`.
+
+    Entries are only dropped from the in-process cache of the current process.
+
+    Returns the number of entries dropped from the shared cache.
+    """
+    count = get_cache().delete_prefix(prefix)
+    _memory_cache.delete_prefix(prefix)
+    _LOGGER.debug("Invalidated %s cache entries with prefix %s", count, prefix)
+    return count
+
+
 @contextlib.contextmanager
 def cache_disabled():
     """Context manager to temporarily disable caching."""
@@ -0,0 +1,140 @@
+"""Typed codec for storing cached values.
+
+Values are stored with a header listing the types of the models (and other dataclasses and
+enums) they contain, tagged with a schema version derived from their fields, followed by the
+value pickled with the standard library pickle, and compressed if it is large. Entries containing
+models that have changed since they were stored fail to decode, and are treated as cache misses,
+instead of being restored with stale fields. Values that can't be pickled by reference
+(e.g. local classes) fall back to cloudpickle.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from enum import Enum
+from functools import lru_cache
+import hashlib
+import importlib
+import pickle
+from typing import Any
+import zlib
+
+import cloudpickle
+import orjson
+
+CODEC_VERSION = 1
+"""Version of the encoding, entries of other versions fail to decode."""
+
+_TYPED = b"T"
+_CLOUDPICKLE = b"P"
+_HEADER_END = b"\n"
+_COMPRESS_MIN_SIZE = 1024
+
+
+class CodecError(ValueError):
+    """Raised when a value can't be decoded."""
+
+
+@lru_cache(maxsize=None)
+def schema_version(cls: type) -> str | None:
+    """Get the schema version of a dataclass, changing when its fields do. None for other types."""
+    if not dataclasses.is_dataclass(cls):
+        return None
+    schema = [(f.name, str(f.type)) for f in dataclasses.fields(cls)]
+    return hashlib.sha256(repr(schema).encode()).hexdigest()[:12]
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in dataclasses.fields(cls))
+
+
+def _type_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+@lru_cache(maxsize=1024)
+def _is_current(path: str, schema: str | None) -> bool:
+    """Check if a stored type still exists with the same schema."""
+    module_name, _, qualname = path.partition(":")
+    try:
+        obj = importlib.import_module(module_name)
+        for name in qualname.split("."):
+            obj = getattr(obj, name)
+    except (ImportError, AttributeError):
+        return False
+    return schema_version(obj) == schema
+
+
+def _collect_types(value: Any) -> dict[type, None]:
+    """Collect the dataclass and enum types in a value graph, in the order they are found."""
+    types: dict[type, None] = {}
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, Enum):
+            types[type(item)] = None
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif dataclasses.is_dataclass(item) and not isinstance(item, type):
+            cls = type(item)
+            types[cls] = None
+            stack.extend(getattr(item, name) for name in _field_names(cls))
+    return types
+
+
+def encode(value: Any, compress_level: int = 1) -> bytes:
+    """Encode a value, pickled behind a header of the types it contains and their schema versions.
+
+    Args:
+        value: Value to encode.
+        compress_level: zlib compression level for large values, 0 to not compress.
+
+    """
+    try:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return _CLOUDPICKLE + cloudpickle.dumps(value)
+    compressed = compress_level > 0 and len(data) >= _COMPRESS_MIN_SIZE
+    if compressed:
+        data = zlib.compress(data, compress_level)
+    types = [(_type_path(cls), schema_version(cls)) for cls in _collect_types(value)]
+    header = orjson.dumps({"v": CODEC_VERSION, "t": types, "z": compressed})
+    return _TYPED + header + _HEADER_END + data
+
+
+def _decode_typed(data: bytes) -> Any:
+    header_end = data.index(_HEADER_END)
+    header = orjson.loads(data[1:header_end])
+    if header["v"] != CODEC_VERSION:
+        raise CodecError(f"Unsupported codec version {header['v']}")
+    for path, schema in header["t"]:
+        if not _is_current(path, schema):
+            raise CodecError(f"Schema of {path} has changed")
+    data = data[header_end + 1 :]
+    if header["z"]:
+        data = zlib.decompress(data)
+    return pickle.loads(data)  # noqa: S301
+
+
+def decode(data: bytes) -> Any:
+    """Decode a value encoded with :func:`encode`.
+
+    Data without a codec tag is assumed to be pickled by an earlier version.
+
+    Raises:
+        CodecError: If the value can't be decoded, e.g. because a model it contains has changed.
+
+    """
+    try:
+        if data[:1] == _TYPED:
+            return _decode_typed(data)
+        if data[:1] == _CLOUDPICKLE:
+            return cloudpickle.loads(data[1:])
+        return cloudpickle.loads(data)
+    except CodecError:
+        raise
+    except Exception as err:
+        raise CodecError(f"Unable to decode cached value: {err}") from err
@@ -9,3 +9,7 @@ NRK_RADIO_INTERACTION_BASE_URL = "https://radio-interaction.nrk.no"
 
 DISK_CACHE_SIZE_LIMIT = 5 * 1024 * 1024 * 1024  # 5GB
 DISK_CACHE_DURATION = 60 * 60  # 1 hour
+DISK_CACHE_DURATION_SHORT = 60  # 1 minute
+DISK_CACHE_DURATION_LONG = 7 * 24 * 60 * 60  # 1 week
+MEMORY_CACHE_MAX_ENTRIES = 1024
+CACHE_EXECUTOR_MAX_WORKERS = 4
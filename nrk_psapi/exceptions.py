@@ -1,5 +1,7 @@
 """nrk-psapi exceptions."""
 
+from __future__ import annotations
+
 
 class NrkPsApiError(Exception):
     """Generic NrkPs exception."""
@@ -20,6 +22,26 @@ class NrkPsApiConnectionTimeoutError(NrkPsApiConnectionError):
 class NrkPsApiRateLimitError(NrkPsApiConnectionError):
     """NrkPs Rate Limit exception."""
 
+    def __init__(self, *args: object, retry_after: float | None = None):
+        super().__init__(*args)
+        self.retry_after = retry_after
+        """Time in seconds the API asked to wait before retrying, if given."""
+
+
+class NrkPsApiServerError(NrkPsApiConnectionError):
+    """NrkPs server error exception, for 5xx responses."""
+
+    def __init__(self, *args: object, status: int, retry_after: float | None = None):
+        super().__init__(*args)
+        self.status = status
+        """HTTP status of the response."""
+        self.retry_after = retry_after
+        """Time in seconds the API asked to wait before retrying, if given."""
+
+
+class NrkPsApiCircuitOpenError(NrkPsApiConnectionError):
+    """NrkPs circuit open exception, raised without a request while an endpoint is failing."""
+
 
 class NrkPsApiAuthenticationError(NrkPsApiError):
     """NrkPs authentication exception."""
@@ -1,3 +1,4 @@
 from .feed import NrkPodcastFeed
+from .state import FeedStateStore
 
-__all__ = ["NrkPodcastFeed"]
+__all__ = ["FeedStateStore", "NrkPodcastFeed"]
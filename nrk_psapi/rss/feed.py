@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -26,6 +27,7 @@ from .extensions import (
     PodcastPerson,
     PodcastSeason,
 )
+from .state import FeedItemState, episode_fingerprint
 
 if TYPE_CHECKING:
     from nrk_psapi import NrkPodcastAPI
@@ -35,6 +37,8 @@ if TYPE_CHECKING:
     )
     from nrk_psapi.models.rss import EpisodeChapter
 
+    from .state import FeedStateStore
+
 
 @dataclass
 class NrkPodcastFeed:
@@ -44,6 +48,10 @@ class NrkPodcastFeed:
     """Base URL. Defaults to NRK_RADIO_BASE_URL."""
     rss_url_suffix: str = ".xml"
     """RSS URL suffix. Defaults to .xml."""
+    concurrency: int = 10
+    """Maximum number of episode items built concurrently. Defaults to 10."""
+    state_store: FeedStateStore | None = None
+    """Store of previously built items. If set, only items for new or changed episodes are built."""
 
     @staticmethod
     async def build_episode_chapters(episode: Episode) -> list[EpisodeChapter]:
@@ -60,6 +68,17 @@ class NrkPodcastFeed:
 
         _LOGGER.debug("Building episode item: %s", episode_id)
         episode = await self.api.get_episode(series_data.id, episode_id)
+        return await self.build_item_from_episode(episode, series_data)
+
+    async def build_item_from_episode(self, episode: Episode, series_data: PodcastSeries) -> Item | None:
+        """Build a :class:`rfeed.rfeed.Item` for an already fetched episode.
+
+        Episodes from listings lack chapters and contributors, those are fetched with
+        :meth:`NrkPodcastAPI.get_episode`. The playback manifest and the file info are always fetched.
+        """
+
+        if episode.index_points is None or episode.contributors is None:
+            episode = await self.api.get_episode(series_data.id, episode.episode_id)
         manifest = await self.api.get_playback_manifest(episode.episode_id, podcast=True)
         episode_file = manifest.playable.assets[0] or None
         if episode_file is None:  # pragma: no cover
@@ -109,11 +128,45 @@ class NrkPodcastFeed:
             **item_attrs,
         )
 
+    async def build_episode_items(
+        self, episodes: list[Episode], series_data: PodcastSeries
+    ) -> list[Item | None]:
+        """Build :class:`rfeed.rfeed.Item` objects for a list of episodes.
+
+        Items are built concurrently, bounded by :attr:`concurrency`, and returned in the same
+        order as the given episodes. If :attr:`state_store` is set, items of episodes that are
+        unchanged since the previous build are reused from the store.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        previous = self.state_store.get_items(series_data.id) if self.state_store is not None else {}
+
+        async def build_item(episode: Episode, fingerprint: str) -> Item | None:
+            state = previous.get(episode.episode_id)
+            if state is not None and state.fingerprint == fingerprint:
+                return state.item
+            async with semaphore:
+                return await self.build_item_from_episode(episode, series_data=series_data)
+
+        fingerprints = [episode_fingerprint(episode) for episode in episodes]
+        items = await asyncio.gather(
+            *[build_item(episode, fingerprint) for episode, fingerprint in zip(episodes, fingerprints)]
+        )
+        if self.state_store is not None:
+            self.state_store.set_items(
+                series_data.id,
+                {
+                    episode.episode_id: FeedItemState(fingerprint, item)
+                    for episode, fingerprint, item in zip(episodes, fingerprints, items)
+                },
+            )
+        return list(items)
+
     async def build_podcast_rss(self, podcast_id: str, limit: int | None = None) -> Feed:
         """Build a complete RSS feed for a podcast.
 
         The RSS feed is returned as a :class:`rfeed.rfeed.Feed` object and can be rendered as
-        XML using the :meth:`rfeed.rfeed.Feed.rss` method.
+        XML using the :meth:`rfeed.rfeed.Feed.rss` method. If :attr:`state_store` is set, the
+        feed is regenerated incrementally, see :meth:`build_episode_items`.
         """
 
         podcast = await self.api.get_podcast(podcast_id)
@@ -170,9 +223,6 @@ class NrkPodcastFeed:
                 ),
                 *extensions,
             ],
-            items=[
-                await self.build_episode_item(episode.episode_id, series_data=podcast.series)
-                for episode in episodes
-            ],
+            items=await self.build_episode_items(episodes, series_data=podcast.series),
             **feed_attrs,
         )
@@ -0,0 +1,47 @@
+"""Feed state, used for incremental regeneration of RSS feeds."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rfeed import Item
+
+    from nrk_psapi.models import Episode
+
+
+def episode_fingerprint(episode: Episode) -> str:
+    """Fingerprint of the episode data a feed item is built from."""
+    return hashlib.sha256(episode.to_jsonb()).hexdigest()
+
+
+@dataclass
+class FeedItemState:
+    """A previously built feed item."""
+
+    fingerprint: str
+    item: Item | None
+
+
+@dataclass
+class FeedStateStore:
+    """In-memory store of previously built feed items, per podcast."""
+
+    feeds: dict[str, dict[str, FeedItemState]] = field(default_factory=dict)
+
+    def get_items(self, podcast_id: str) -> dict[str, FeedItemState]:
+        """Get the previously built items for a podcast, keyed by episode id."""
+        return self.feeds.get(podcast_id, {})
+
+    def set_items(self, podcast_id: str, items: dict[str, FeedItemState]) -> None:
+        """Replace the stored items for a podcast."""
+        self.feeds[podcast_id] = items
+
+    def clear(self, podcast_id: str | None = None) -> None:
+        """Forget the stored items for a podcast, or for all podcasts."""
+        if podcast_id is None:
+            self.feeds.clear()
+        else:
+            self.feeds.pop(podcast_id, None)
@@ -0,0 +1,406 @@
+"""Client-side rate limiting, adaptive concurrency control, retries, circuit breaking and hedging."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import contextlib
+from dataclasses import dataclass, field
+import math
+import random
+import time
+from typing import TYPE_CHECKING
+
+from aiohttp.hdrs import METH_GET, METH_HEAD
+
+from .const import LOGGER as _LOGGER
+from .exceptions import (
+    NrkPsApiCircuitOpenError,
+    NrkPsApiConnectionError,
+    NrkPsApiConnectionTimeoutError,
+    NrkPsApiRateLimitError,
+    NrkPsApiServerError,
+)
+from .models.common import StrEnum
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from yarl import URL
+
+
+class TokenBucket:
+    """Token bucket rate limiter.
+
+    Args:
+        rate: Number of tokens added per second.
+        capacity: Maximum number of tokens, i.e. the largest allowed burst. Defaults to `rate`.
+
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Number of tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """Wait until `tokens` tokens are available, and take them."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
+
+
+class AdaptiveConcurrencyLimiter:
+    """Concurrency limit adjusted with additive increase/multiplicative decrease (AIMD).
+
+    The limit grows by one for every `limit` successful requests, and is multiplied by
+    `decrease_factor` when a request fails because the server is overloaded (rate limited
+    or timed out). Requests that started before the last decrease don't decrease it again.
+
+    Args:
+        max_limit: Upper bound of the limit, also the initial limit.
+        min_limit: Lower bound of the limit.
+        decrease_factor: Factor the limit is multiplied with on overload.
+
+    """
+
+    overload_exceptions: tuple[type[BaseException], ...] = (
+        NrkPsApiRateLimitError,
+        NrkPsApiConnectionTimeoutError,
+    )
+
+    def __init__(self, max_limit: int, min_limit: int = 1, decrease_factor: float = 0.5):
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= max_limit")
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.decrease_factor = decrease_factor
+        self._limit = float(max_limit)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def release(self, started: float, overloaded: bool | None) -> None:
+        """Release a slot, adjusting the limit by the outcome of the request.
+
+        Args:
+            started: Monotonic time the request got its slot.
+            overloaded: True if the server was overloaded, False on success, None to leave the limit as is.
+
+        """
+        async with self._condition:
+            self._in_flight -= 1
+            if overloaded is True and started >= self._last_decrease:
+                self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+                self._last_decrease = time.monotonic()
+                _LOGGER.debug("Concurrency limit decreased to %s", self.limit)
+            elif overloaded is False and self._limit < self.max_limit:
+                self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+    @contextlib.asynccontextmanager
+    async def request(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of a request."""
+        await self.acquire()
+        started = time.monotonic()
+        try:
+            yield
+        except self.overload_exceptions:
+            await self.release(started, overloaded=True)
+            raise
+        except BaseException:
+            await self.release(started, overloaded=None)
+            raise
+        await self.release(started, overloaded=False)
+
+
+class RetryBudget:
+    """Limits retries to a fraction of the requests made, so retries can't amplify an outage.
+
+    Every request deposits `ratio` tokens, and every retry withdraws one.
+
+    Args:
+        ratio: Number of retries allowed per request.
+        min_retries: Number of retries available up front, and the least the budget is refilled to.
+        capacity: Maximum number of tokens the budget can hold.
+
+    """
+
+    def __init__(self, ratio: float = 0.1, min_retries: int = 10, capacity: float = 100):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.capacity = max(capacity, min_retries)
+        self._balance = float(min_retries)
+
+    @property
+    def balance(self) -> float:
+        """Number of retries currently allowed."""
+        return self._balance
+
+    def deposit(self) -> None:
+        """Record a request."""
+        self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take a retry from the budget, returns False if it is spent."""
+        if self._balance < 1:
+            return False
+        self._balance -= 1
+        return True
+
+
+@dataclass
+class RetryPolicy:
+    """Policy for retrying requests that failed with a transient error.
+
+    Retries wait an exponentially increasing time with full jitter, i.e. a random time
+    between 0 and `min(max_delay, base_delay * 2 ** attempt)`, or the time the API asked for
+    with a Retry-After header, e.g. on 429 and 503 responses.
+    """
+
+    max_retries: int = 3
+    """Maximum number of retries per request."""
+    base_delay: float = 0.5
+    """Time in seconds the backoff starts at."""
+    max_delay: float = 30
+    """Maximum time in seconds to wait before a retry. Requests are not retried if the API asks to wait longer."""
+    methods: frozenset[str] = frozenset({METH_GET, METH_HEAD})
+    """HTTP methods to retry, should only be idempotent ones."""
+    exceptions: tuple[type[BaseException], ...] = (NrkPsApiConnectionError,)
+    """Exceptions to retry."""
+    server_error_statuses: frozenset[int] = frozenset({502, 503, 504})
+    """Statuses of server errors to retry, other server errors are not transient."""
+    budget: RetryBudget | None = field(default_factory=RetryBudget)
+    """Budget shared by all requests, None to not limit retries beyond `max_retries`."""
+
+    def get_backoff(self, attempt: int) -> float:
+        """Get the time in seconds to wait before retry number `attempt` (counting from 0)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))  # noqa: S311
+
+    def on_request(self) -> None:
+        """Record a request in the retry budget."""
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def get_retry_delay(self, method: str, attempt: int, exception: BaseException) -> float | None:
+        """Get the time in seconds to wait before retrying a failed request, or None to not retry it."""
+        if method.upper() not in self.methods or attempt >= self.max_retries:
+            return None
+        if not isinstance(exception, self.exceptions):
+            return None
+        if isinstance(exception, NrkPsApiServerError) and exception.status not in self.server_error_statuses:
+            return None
+        delay = getattr(exception, "retry_after", None)
+        if delay is None:
+            delay = self.get_backoff(attempt)
+        elif delay > self.max_delay:
+            return None
+        if self.budget is not None and not self.budget.withdraw():
+            _LOGGER.debug("Retry budget spent, not retrying")
+            return None
+        return delay
+
+
+def get_endpoint_family(url: URL) -> str:
+    """Get the endpoint family of an API url, e.g. `catalog` for `/radio/catalog/podcast/{podcast_id}`."""
+    segments = [segment for segment in url.path.split("/") if segment]
+    if segments and segments[0] == "radio":
+        segments = segments[1:]
+    return segments[0] if segments else ""
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker failing requests fast while an endpoint is failing.
+
+    Requests failing to connect, timing out or getting a 5xx response count as failed. Other error
+    responses mean the endpoint is up, and count as successful.
+
+    The circuit opens after `failure_threshold` consecutive failed requests, after which requests
+    fail immediately with `NrkPsApiCircuitOpenError`. After `recovery_time` seconds the circuit
+    is half-open, and a single probe request is let through. The circuit closes if the probe
+    succeeds, and opens again if it fails.
+
+    Args:
+        failure_threshold: Number of consecutive failures that opens the circuit.
+        recovery_time: Time in seconds to wait before probing an open circuit.
+
+    """
+
+    failure_exceptions: tuple[type[BaseException], ...] = (NrkPsApiConnectionError, NrkPsApiServerError)
+    ignored_exceptions: tuple[type[BaseException], ...] = (
+        NrkPsApiRateLimitError,
+        NrkPsApiCircuitOpenError,
+    )
+
+    def __init__(self, failure_threshold: int = 5, recovery_time: float = 30):
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the circuit."""
+        if self._state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self.recovery_time:
+            return CircuitState.HALF_OPEN
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Check if a request may be made, marking it as the probe if the circuit is half-open."""
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and not self._probing:
+            self._state = CircuitState.HALF_OPEN
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+        if self._state != CircuitState.CLOSED:
+            _LOGGER.debug("Circuit closed")
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Record a failed request."""
+        self._failures += 1
+        if self._state == CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state != CircuitState.OPEN:
+                _LOGGER.debug("Circuit opened after %s failures", self._failures)
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+    @contextlib.asynccontextmanager
+    async def request(self) -> AsyncIterator[None]:
+        """Guard a request, recording its outcome."""
+        if not self.allow_request():
+            raise NrkPsApiCircuitOpenError("Circuit open, NRK API endpoint is failing. Try again later.")
+        try:
+            yield
+        except self.ignored_exceptions:
+            self._probing = False
+            raise
+        except self.failure_exceptions:
+            self.record_failure()
+            raise
+        except asyncio.CancelledError:
+            self._probing = False
+            raise
+        except BaseException:
+            # Any other error is a response from the endpoint, which means it is up
+            self.record_success()
+            raise
+        self.record_success()
+
+
+class LatencyTracker:
+    """Tracks the latency of the most recent requests.
+
+    Args:
+        window: Number of latencies to keep.
+
+    """
+
+    def __init__(self, window: int = 200):
+        self._latencies: deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        return len(self._latencies)
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a request."""
+        self._latencies.append(latency)
+
+    def percentile(self, percentile: float) -> float | None:
+        """Get the given percentile (0-100) of the recorded latencies, or None if none are recorded."""
+        if not self._latencies:
+            return None
+        latencies = sorted(self._latencies)
+        rank = math.ceil(percentile / 100 * len(latencies))
+        return latencies[min(max(rank, 1), len(latencies)) - 1]
+
+
+@dataclass
+class HedgePolicy:
+    """Policy for hedging latency-critical requests.
+
+    If a request hasn't completed within the `percentile` latency of recent requests to the same
+    endpoint family, a duplicate request is sent, and the first response is used.
+    """
+
+    percentile: float = 95
+    """Percentile of recent latencies to wait for before hedging."""
+    min_samples: int = 20
+    """Number of latencies to record before using the percentile, `initial_delay` is used until then."""
+    initial_delay: float = 1
+    """Time in seconds to wait before hedging while too few latencies are recorded."""
+    min_delay: float = 0.01
+    """Minimum time in seconds to wait before hedging."""
+    max_hedges: int = 1
+    """Maximum number of duplicate requests to send."""
+    window: int = 200
+    """Number of latencies to keep per endpoint family."""
+    _trackers: dict[str, LatencyTracker] = field(default_factory=dict, init=False, repr=False)
+
+    def get_tracker(self, family: str) -> LatencyTracker:
+        """Get the latency tracker of an endpoint family."""
+        if family not in self._trackers:
+            self._trackers[family] = LatencyTracker(self.window)
+        return self._trackers[family]
+
+    def get_delay(self, family: str) -> float:
+        """Get the time in seconds to wait for a request to an endpoint family before hedging."""
+        tracker = self.get_tracker(family)
+        if len(tracker) < self.min_samples:
+            return self.initial_delay
+        return max(self.min_delay, tracker.percentile(self.percentile))
+
+    def record(self, family: str, latency: float) -> None:
+        """Record the latency of a request to an endpoint family."""
+        self.get_tracker(family).record(latency)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from fractions import Fraction
 from http import HTTPStatus
 from io import BytesIO
@@ -14,6 +16,8 @@ from PIL import Image as PILImage
 from nrk_psapi.const import LOGGER as _LOGGER
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from yarl import URL
 
     from nrk_psapi.models import FetchedFileInfo, Image
@@ -48,6 +52,58 @@ def sanitize_string(s: str, delimiter: str = "_"):
     return re.sub(rf"^[0-9{delimiter}]+", "", re.sub(rf"[^a-z0-9{delimiter}]", "", s))[:50].rstrip(delimiter)
 
 
+def parse_http_date(value: str) -> datetime:
+    """Parse an HTTP date as an aware datetime. Dates without a time zone, e.g. `-0000`, are in UTC."""
+    parsed = parsedate_to_datetime(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def parse_cache_headers(headers: Mapping[str, str]) -> float | None:
+    """Get the time in seconds a response may be cached for, from its Cache-Control/Expires headers.
+
+    Returns None if the headers don't say, and 0 if the response should not be cached.
+    """
+    if cache_control := headers.get("Cache-Control"):
+        directives = {}
+        for directive in cache_control.split(","):
+            name, _, value = directive.strip().partition("=")
+            directives[name.lower()] = value.strip('"')
+        if "no-store" in directives or "no-cache" in directives:
+            return 0
+        for name in ("s-maxage", "max-age"):
+            if directives.get(name, "").isdigit():
+                age = headers.get("Age", "0")
+                return max(int(directives[name]) - (int(age) if age.isdigit() else 0), 0)
+
+    if expires := headers.get("Expires"):
+        try:
+            expires_at = parse_http_date(expires)
+            date = parse_http_date(headers["Date"]) if "Date" in headers else datetime.now(tz=timezone.utc)
+            return max((expires_at - date).total_seconds(), 0)
+        except (TypeError, ValueError):
+            # Invalid dates mean the response is already expired
+            return 0
+    return None
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Get the time in seconds to wait before retrying, from a Retry-After header.
+
+    The header is either a number of seconds, or an HTTP date. Returns None if it is missing or invalid.
+    """
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        retry_at = parse_http_date(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(tz=timezone.utc)).total_seconds(), 0)
+
+
 async def fetch_file_info(url: URL | str, session: ClientSession | None = None) -> FetchedFileInfo:
     """Retrieve content-length and content-type for the given URL."""
     close_session = False
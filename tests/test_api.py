@@ -241,6 +241,171 @@ async def test_get_all_podcast_episodes(
         assert all(isinstance(item, Episode) for item in result)
 
 
+@pytest.mark.parametrize(
+    "podcast_id",
+    [
+        "tore_sagens_podkast",
+    ],
+)
+async def test_get_all_podcast_episodes_concurrent(
+    aresponses: ResponsesMockServer,
+    podcast_id: str,
+):
+    page_size = 15
+
+    uri = f"/radio/catalog/podcast/{podcast_id}/episodes"
+    fixtures = [load_fixture_json(f"radio_catalog_podcast_{podcast_id}_episodes_page{n}") for n in (1, 2)]
+    total_count = sum(len(f["_embedded"]["episodes"]) for f in fixtures)
+    fixtures[0]["totalCount"] = total_count
+    for page_no, fixture in enumerate(fixtures, start=1):
+        aresponses.add(
+            response=json_response(data=fixture),
+            route=CustomRoute(
+                host_pattern=URL(PSAPI_BASE_URL).host,
+                path_pattern=uri,
+                path_qs={"pageSize": page_size, "page": page_no},
+                method_pattern="GET",
+            ),
+        )
+
+    async with aiohttp.ClientSession() as session:
+        nrk_api = NrkPodcastAPI(session=session, enable_cache=False, page_concurrency=4)
+        result = await nrk_api.get_podcast_episodes(podcast_id, page_size=page_size, page=-1)
+        assert len(result) == total_count
+        assert [e.episode_id for e in result] == [
+            e["episodeId"] for f in fixtures for e in f["_embedded"]["episodes"]
+        ]
+
+
+@pytest.mark.parametrize(
+    ("missing_page", "raises"),
+    [
+        (3, False),
+        (2, True),
+    ],
+)
+async def test_get_all_podcast_episodes_concurrent_missing_page(
+    aresponses: ResponsesMockServer,
+    missing_page: int,
+    raises: bool,
+):
+    """Only missing pages at the end are tolerated, e.g. of a stale total count."""
+    podcast_id = "tore_sagens_podkast"
+    page_size = 15
+
+    uri = f"/radio/catalog/podcast/{podcast_id}/episodes"
+    fixtures = [load_fixture_json(f"radio_catalog_podcast_{podcast_id}_episodes_page{n}") for n in (1, 2)]
+    fixtures[0]["totalCount"] = page_size * 3
+    pages = {1: fixtures[0], 5 - missing_page: fixtures[1]}
+    for page_no in (1, 2, 3):
+        response = (
+            json_response(data=pages[page_no])
+            if page_no in pages
+            else aresponses.Response(text="Not found", status=404)
+        )
+        aresponses.add(
+            response=response,
+            route=CustomRoute(
+                host_pattern=URL(PSAPI_BASE_URL).host,
+                path_pattern=uri,
+                path_qs={"pageSize": page_size, "page": page_no},
+                method_pattern="GET",
+            ),
+        )
+
+    async with aiohttp.ClientSession() as session:
+        nrk_api = NrkPodcastAPI(session=session, enable_cache=False)
+        coro = nrk_api._request_paged_all(
+            uri, page_size=page_size, items_key="_embedded.episodes", concurrency=4
+        )
+        if raises:
+            with pytest.raises(NrkPsApiNotFoundError, match="Page 2"):
+                await coro
+        else:
+            result = await coro
+            assert [e["episodeId"] for e in result] == [
+                e["episodeId"] for f in fixtures for e in f["_embedded"]["episodes"]
+            ]
+
+
+@pytest.mark.parametrize(
+    "podcast_id",
+    [
+        "tore_sagens_podkast",
+    ],
+)
+async def test_get_all_podcast_episodes_concurrent_probing(
+    aresponses: ResponsesMockServer,
+    podcast_id: str,
+):
+    page_size = 15
+
+    uri = f"/radio/catalog/podcast/{podcast_id}/episodes"
+    fixtures = [load_fixture_json(f"radio_catalog_podcast_{podcast_id}_episodes_page{n}") for n in (1, 2)]
+    for page_no, fixture in enumerate(fixtures, start=1):
+        aresponses.add(
+            response=json_response(data=fixture),
+            route=CustomRoute(
+                host_pattern=URL(PSAPI_BASE_URL).host,
+                path_pattern=uri,
+                path_qs={"pageSize": page_size, "page": page_no},
+                method_pattern="GET",
+            ),
+        )
+    aresponses.add(
+        response=aresponses.Response(text="Not found", status=404),
+        route=CustomRoute(
+            host_pattern=URL(PSAPI_BASE_URL).host,
+            path_pattern=uri,
+            path_qs={"pageSize": page_size, "page": 3},
+            method_pattern="GET",
+        ),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        nrk_api = NrkPodcastAPI(session=session, enable_cache=False)
+        result = await nrk_api._request_paged_all(
+            uri, page_size=page_size, items_key="_embedded.episodes", concurrency=2
+        )
+        assert [e["episodeId"] for e in result] == [
+            e["episodeId"] for f in fixtures for e in f["_embedded"]["episodes"]
+        ]
+
+
+@pytest.mark.parametrize(
+    "podcast_id",
+    [
+        "tore_sagens_podkast",
+    ],
+)
+async def test_iter_podcast_episodes(
+    aresponses: ResponsesMockServer,
+    podcast_id: str,
+):
+    page_size = 15
+
+    uri = f"/radio/catalog/podcast/{podcast_id}/episodes"
+    fixtures = [load_fixture_json(f"radio_catalog_podcast_{podcast_id}_episodes_page{n}") for n in (1, 2)]
+    for page_no, fixture in enumerate(fixtures, start=1):
+        aresponses.add(
+            response=json_response(data=fixture),
+            route=CustomRoute(
+                host_pattern=URL(PSAPI_BASE_URL).host,
+                path_pattern=uri,
+                path_qs={"pageSize": page_size, "page": page_no},
+                method_pattern="GET",
+            ),
+        )
+
+    async with aiohttp.ClientSession() as session:
+        nrk_api = NrkPodcastAPI(session=session, enable_cache=False)
+        result = [e async for e in nrk_api.iter_podcast_episodes(podcast_id, page_size=page_size)]
+        assert all(isinstance(item, Episode) for item in result)
+        assert [e.episode_id for e in result] == [
+            e["episodeId"] for f in fixtures for e in f["_embedded"]["episodes"]
+        ]
+
+
 @pytest.mark.parametrize(
     ("podcast_id", "season_id"),
     [
@@ -401,6 +566,31 @@ async def test_get_all_series_episodes(
         assert all(isinstance(item, Episode) for item in result)
 
 
+@pytest.mark.parametrize(
+    ("series_id", "season_id"),
+    [
+        ("karsten-og-petra-radio", "200511"),
+    ],
+)
+async def test_iter_series_episodes(
+    aresponses: ResponsesMockServer,
+    series_id: str,
+    season_id: str,
+):
+    fixture = load_fixture_json(f"radio_catalog_series_{series_id}_seasons_{season_id}_episodes")
+    aresponses.add(
+        URL(PSAPI_BASE_URL).host,
+        f"/radio/catalog/series/{series_id}/seasons/{season_id}/episodes",
+        "GET",
+        json_response(data=fixture),
+    )
+    async with aiohttp.ClientSession() as session:
+        nrk_api = NrkPodcastAPI(session=session, enable_cache=False)
+        result = [e async for e in nrk_api.iter_series_episodes(series_id, season_id, page_size=20)]
+        assert len(result) == len(fixture["_embedded"]["episodes"])
+        assert all(isinstance(item, Episode) for item in result)
+
+
 @pytest.mark.parametrize(
     "podcast_id",
     [
@@ -477,6 +667,46 @@ async def test_browse(aresponses: ResponsesMockServer, category: str, letter: st
         assert all(isinstance(item, SeriesListItem) for item in result.series)
 
 
+async def test_iter_browse(aresponses: ResponsesMockServer):
+    per_page = 10
+    category = "kultur"
+    uri = f"/radio/search/categories/{category}"
+    first_page = load_fixture_json(f"radio_search_categories_{category}")
+    last_page = {**first_page, "_links": {}}
+    for page_no, fixture in enumerate((first_page, last_page), start=1):
+        aresponses.add(
+            response=json_response(data=fixture),
+            route=CustomRoute(
+                host_pattern=URL(PSAPI_BASE_URL).host,
+                path_pattern=uri,
+                path_qs={"take": per_page, "skip": per_page * (page_no - 1)},
+                method_pattern="GET",
+            ),
+        )
+    async with aiohttp.ClientSession() as session:
+        nrk_api = NrkPodcastAPI(session=session, enable_cache=False)
+        result = [s async for s in nrk_api.iter_browse(category=category, per_page=per_page)]
+        assert len(result) == len(first_page["series"]) * 2
+        assert all(isinstance(item, SeriesListItem) for item in result)
+
+
+async def test_iter_browse_early_exit(aresponses: ResponsesMockServer):
+    """Make sure a pending prefetch is cancelled when the caller stops iterating."""
+    aresponses.add(
+        URL(PSAPI_BASE_URL).host,
+        "/radio/search/categories/kultur",
+        "GET",
+        json_response(data=load_fixture_json("radio_search_categories_kultur")),
+        repeat=2,
+    )
+    async with aiohttp.ClientSession() as session:
+        nrk_api = NrkPodcastAPI(session=session, enable_cache=False)
+        iterator = nrk_api.iter_browse(category="kultur", per_page=10)
+        item = await iterator.__anext__()
+        assert isinstance(item, SeriesListItem)
+        await iterator.aclose()
+
+
 @pytest.mark.parametrize(
     "query",
     ["beyer"],
@@ -628,6 +858,89 @@ async def test_get_episode(
         assert isinstance(result, Episode)
 
 
+async def test_get_podcasts_partial_results(aresponses: ResponsesMockServer):
+    podcast_ids = ["tore_sagens_podkast", "missing", "hele_historien"]
+    for podcast_id in podcast_ids:
+        response = (
+            aresponses.Response(status=404)
+            if podcast_id == "missing"
+            else json_response(data=load_fixture_json(f"radio_catalog_podcast_{podcast_id}"))
+        )
+        aresponses.add(URL(PSAPI_BASE_URL).host, f"/radio/catalog/podcast/{podcast_id}", "GET", response)
+    aresponses.add(
+        URL(PSAPI_BASE_URL).host,
+        "/radio/catalog/podcast/missing",
+        "GET",
+        aresponses.Response(status=404),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        nrk_api = NrkPodcastAPI(session=session, enable_cache=False)
+        results = await nrk_api.get_podcasts(podcast_ids, concurrency=1, return_exceptions=True)
+        assert [type(result) for result in results] == [
+            PodcastStandard,
+            NrkPsApiNotFoundError,
+            PodcastUmbrella,
+        ]
+        with pytest.raises(NrkPsApiNotFoundError):
+            await nrk_api.get_podcasts(["missing"])
+
+
+async def test_iter_podcasts(aresponses: ResponsesMockServer):
+    async def slow_response(_request):
+        await asyncio.sleep(0.1)
+        return json_response(data=load_fixture_json("radio_catalog_podcast_tore_sagens_podkast"))
+
+    aresponses.add(
+        URL(PSAPI_BASE_URL).host, "/radio/catalog/podcast/tore_sagens_podkast", "GET", slow_response
+    )
+    aresponses.add(
+        URL(PSAPI_BASE_URL).host,
+        "/radio/catalog/podcast/hele_historien",
+        "GET",
+        json_response(data=load_fixture_json("radio_catalog_podcast_hele_historien")),
+    )
+
+    async with aiohttp.ClientSession() as session:
+        nrk_api = NrkPodcastAPI(session=session, enable_cache=False)
+        podcast_ids = [
+            podcast_id
+            async for podcast_id, _ in nrk_api.iter_podcasts(["tore_sagens_podkast", "hele_historien"])
+        ]
+        assert podcast_ids == ["hele_historien", "tore_sagens_podkast"]
+
+
+async def test_get_episodes(aresponses: ResponsesMockServer):
+    podcast_id = "desken_brenner"
+    episode_id = "l_8c60be4d-ce0b-41d0-a0be-4dce0b81d01a"
+    fixture = load_fixture_json(f"radio_catalog_podcast_{podcast_id}_episodes_{episode_id}")
+    aresponses.add(
+        URL(PSAPI_BASE_URL).host,
+        f"/radio/catalog/podcast/{podcast_id}/episodes/{episode_id}",
+        "GET",
+        json_response(data=fixture),
+    )
+    aresponses.add(
+        URL(PSAPI_BASE_URL).host,
+        f"/radio/catalog/podcast/{podcast_id}/episodes/missing",
+        "GET",
+        aresponses.Response(status=404),
+    )
+    async with aiohttp.ClientSession() as session:
+        nrk_api = NrkPodcastAPI(session=session, enable_cache=False)
+        results = await nrk_api.get_episodes(
+            [
+                (podcast_id, episode_id),
+                (podcast_id, "missing"),
+                (podcast_id, episode_id),
+            ]
+        )
+        assert isinstance(results[0], Episode)
+        assert isinstance(results[1], NrkPsApiNotFoundError)
+        assert results[2] is results[0]
+    aresponses.assert_plan_strictly_followed()
+
+
 @pytest.mark.parametrize(
     "channel_id",
     [
@@ -914,6 +1227,35 @@ async def test_internal_session(aresponses: ResponsesMockServer):
         assert response == {"status": "ok"}
 
 
+async def test_shared_connection_pool(aresponses: ResponsesMockServer):
+    """Test that internal sessions share one configured connection pool."""
+    aresponses.add(
+        URL(PSAPI_BASE_URL).host,
+        "/ipcheck",
+        "GET",
+        json_response(data={"status": "ok"}),
+    )
+    async with NrkPodcastAPI(
+        enable_cache=False,
+        disable_credentials_storage=True,
+        connection_limit=10,
+        connection_limit_per_host=5,
+        dns_cache_ttl=60,
+    ) as nrk_api:
+        await nrk_api._request("ipcheck")
+        connector = nrk_api.connector
+        assert isinstance(connector, aiohttp.TCPConnector)
+        assert connector.limit == 10
+        assert connector.limit_per_host == 5
+        assert nrk_api.session.connector is connector
+        assert nrk_api.auth_client.connector is connector
+        nrk_api.auth_client.setup_session()
+        assert nrk_api.auth_client.session.connector is connector
+    assert connector.closed
+    assert nrk_api.session.closed
+    assert nrk_api.auth_client.session.closed
+
+
 async def test_timeout(aresponses: ResponsesMockServer):
     """Test request timeout."""
 
@@ -971,13 +1313,18 @@ async def test_http_error429(aresponses: ResponsesMockServer):
         URL(PSAPI_BASE_URL).host,
         "/ipcheck",
         "GET",
-        aresponses.Response(text="Too many requests", status=429),
+        aresponses.Response(
+            text="Too many requests",
+            status=429,
+            headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 -0000"},
+        ),
     )
 
     async with aiohttp.ClientSession() as session:
         nrk_api = NrkPodcastAPI(session=session, enable_cache=False)
-        with pytest.raises(NrkPsApiRateLimitError):
+        with pytest.raises(NrkPsApiRateLimitError) as exc_info:
             assert await nrk_api._request("ipcheck")
+        assert exc_info.value.retry_after == 0
 
 
 async def test_network_error():
@@ -1031,3 +1378,12 @@ async def test_context_manager():
     async with NrkPodcastAPI() as api:
         assert isinstance(api, NrkPodcastAPI)
     assert api.session is None or api.session.closed
+
+
+def test_season_tags():
+    """Season ids are reused across series, so their tags are namespaced by the series."""
+    from nrk_psapi.api import _podcast_tags, _series_tags
+
+    assert _podcast_tags(None, "hele_historien", "2021")["season"] == "hele_historien/2021"
+    assert _series_tags(None, "lindmo", "2021")["season"] == "lindmo/2021"
+    assert _podcast_tags(None, "hele_historien")["season"] is None
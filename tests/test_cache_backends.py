@@ -0,0 +1,127 @@
+"""Tests for the cache backends."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+
+def check_backend(backend, get_set_expire_time=None):
+    from diskcache.core import ENOVAL
+
+    from nrk_psapi.cache_backends import CacheBackend
+
+    assert isinstance(backend, CacheBackend)
+    assert backend.set("a", {"x": 1})
+    assert backend.get("a") == {"x": 1}
+    assert backend.get("missing", default=ENOVAL) is ENOVAL
+
+    backend.set("b", 2, expire=60)
+    value, expire_time = backend.get("b", expire_time=True)
+    assert value == 2
+    assert expire_time == pytest.approx(time.time() + 60, abs=5)
+
+    backend.set_many([("c", 3, None), ("d", 4, 60)])
+    entries = backend.get_many(["a", "c", "d", "missing"])
+    assert {key: value for key, (value, _) in entries.items()} == {"a": {"x": 1}, "c": 3, "d": 4}
+    assert entries["c"][1] is None
+    assert len(backend) == 4
+
+    assert backend.delete("a")
+    assert not backend.delete("a")
+    assert backend.clear() == 3
+    assert len(backend) == 0
+
+    if get_set_expire_time is None:
+
+        def get_set_expire_time(key):
+            return backend.get(key, expire_time=True)[1]
+
+    backend.add_to_sets([("tag", [("f", 1), ("f", 2)], 60), ("other", [("f", 4)], None)])
+    backend.add_to_sets([("tag", [("f", 2), ("f", 3)], 10)])
+    # Sets expire with the longest lived of their members
+    assert get_set_expire_time("tag") == pytest.approx(time.time() + 60, abs=5)
+    backend.add_to_sets([("tag", [("f", 3)], None)])
+    assert get_set_expire_time("tag") is None
+    assert backend.pop_set("tag") == {("f", 1), ("f", 2), ("f", 3)}
+    assert backend.pop_set("tag") == set()
+    assert backend.pop_set("other") == {("f", 4)}
+
+    backend.set_many([(("pkg.get_podcast", "a"), 1, None), (("pkg.get_podcast_episodes", "a"), 2, None)])
+    backend.set(("pkg.get_series", "a"), 3)
+    assert backend.delete_prefix("pkg.get_podcast") == 2
+    assert backend.get(("pkg.get_series", "a")) == 3
+
+
+def test_disk_backend(tmp_path):
+    from nrk_psapi.cache_backends import DiskBackend, ShardedDiskBackend
+
+    check_backend(DiskBackend(str(tmp_path / "disk")))
+    check_backend(ShardedDiskBackend(str(tmp_path / "sharded"), shards=4))
+
+
+def test_memory_backend(monkeypatch):
+    from nrk_psapi import cache_backends
+    from nrk_psapi.cache_backends import MemoryBackend
+
+    check_backend(MemoryBackend())
+
+    backend = MemoryBackend(max_entries=2)
+    for key in ("a", "b", "c"):
+        backend.set(key, key)
+    assert "a" not in backend.get_many(["a", "b", "c"])
+
+    backend.set("expired", 1, expire=-1)
+    assert backend.expire() == 1
+    assert len(backend) == 1
+
+    def decode(_data):
+        raise cache_backends.CodecError("Schema has changed")
+
+    monkeypatch.setattr(cache_backends, "decode", decode)
+    assert backend.get("c") is None
+
+
+def test_redis_backend():
+    fakeredis = pytest.importorskip("fakeredis")
+    from nrk_psapi.cache_backends import RedisBackend
+
+    client = fakeredis.FakeRedis()
+    client.set("other", 1)
+    backend = RedisBackend(client=client)
+
+    def get_set_expire_time(key):
+        ttl = client.pttl(backend._key(key))
+        return None if ttl < 0 else time.time() + ttl / 1000
+
+    check_backend(backend, get_set_expire_time)
+    # Keys outside the prefix of the cache are left alone
+    assert client.get("other") == b"1"
+
+
+async def test_cache_backend(test_cache):
+    """Make sure cached functions use the configured backend."""
+    from nrk_psapi.cache_backends import MemoryBackend
+    from nrk_psapi.caching import get_cache, get_memory_cache, set_cache_backend
+
+    backend = MemoryBackend()
+    set_cache_backend(backend)
+    assert get_cache() is backend
+
+    store = []
+
+    @test_cache
+    async def f(x):
+        store.append(x)
+        return [x]
+
+    assert await f(1) == [1]
+    assert len(backend) == 1
+
+    get_memory_cache().clear()
+    assert await f(1) == [1]
+    assert len(store) == 1
+
+    set_cache_backend(None)
+    assert get_cache() is not backend
@@ -1,8 +1,11 @@
 """Tests for NrkPodcastAPI caching."""
 
+import asyncio
+import os
 from unittest.mock import MagicMock
 
 import diskcache
+import pytest
 
 
 async def test_get_cache(test_cache):
@@ -103,3 +106,762 @@ async def test_cache_disabled_decorator(test_cache):
 
     fn()
     assert mock.call_count == 2
+
+
+async def test_memory_cache_in_front_of_disk(test_cache):
+    """Make sure hits are served from the in-process cache without touching the disk cache."""
+    import nrk_psapi
+
+    store = []
+
+    @test_cache
+    async def f(x):
+        store.append(1)
+        return x
+
+    assert await f(1) == 1
+    assert len(store) == 1
+
+    nrk_psapi.get_cache().clear()
+    assert await f(1) == 1
+    assert len(store) == 1
+
+    nrk_psapi.clear_cache()
+    assert await f(1) == 1
+    assert len(store) == 2
+
+
+async def test_memory_cache_filled_from_disk(test_cache):
+    """Make sure disk cache hits populate the in-process cache."""
+    from nrk_psapi.caching import get_memory_cache
+
+    store = []
+
+    @test_cache
+    async def f(x):
+        store.append(1)
+        return x
+
+    await f(1)
+    get_memory_cache().clear()
+    await f(1)
+    assert len(store) == 1
+    assert len(get_memory_cache()) == 1
+
+
+def test_memory_cache_lru():
+    from nrk_psapi.caching import MemoryCache
+
+    memory = MemoryCache(max_entries=2)
+    memory.set("a", 1)
+    memory.set("b", 2)
+    assert memory.get("a") == 1
+    memory.set("c", 3)
+    assert memory.get("b") is None
+    assert memory.get("a") == 1
+    assert memory.get("c") == 3
+    assert len(memory) == 2
+
+
+def test_memory_cache_expire(monkeypatch):
+    from nrk_psapi import caching
+
+    memory = caching.MemoryCache()
+    now = 1000.0
+    monkeypatch.setattr(caching.time, "time", lambda: now)
+    memory.set("a", 1, expire=10)
+    assert memory.get("a", expire_time=True) == (1, 1010.0)
+    now = 1010.0
+    assert memory.get("a", default="missing") == "missing"
+    assert len(memory) == 0
+
+
+def test_memory_cache_max_size():
+    from nrk_psapi.caching import MemoryCache
+
+    memory = MemoryCache(max_entries=None, max_size=100)
+    assert memory.set("small", b"x")
+    assert not memory.set("large", b"x" * 200)
+    assert memory.get("large") is None
+    for i in range(10):
+        memory.set(i, b"x" * 20)
+    assert memory.size <= 100
+    assert memory.get("small") is None
+    assert memory.get(9) == b"x" * 20
+
+    memory = MemoryCache(max_entries=0)
+    assert not memory.set("a", 1)
+
+
+async def test_single_flight(test_cache):
+    """Make sure concurrent callers for the same key share a single call."""
+    calls = []
+
+    @test_cache
+    async def f(x):
+        calls.append(x)
+        await asyncio.sleep(0.05)
+        return x
+
+    results = await asyncio.gather(*[f(1) for _ in range(50)], f(2))
+    assert results == [1] * 50 + [2]
+    assert sorted(calls) == [1, 2]
+
+
+async def test_single_flight_error(test_cache):
+    """Make sure errors are passed on to all waiting callers, and are not cached."""
+    calls = []
+
+    @test_cache
+    async def f(x):
+        calls.append(x)
+        await asyncio.sleep(0.05)
+        raise ValueError(x)
+
+    results = await asyncio.gather(*[f(1) for _ in range(5)], return_exceptions=True)
+    assert all(isinstance(r, ValueError) for r in results)
+    assert len(calls) == 1
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        await f(1)
+    assert len(calls) == 2
+
+
+async def test_stale_while_revalidate(test_cache, monkeypatch):
+    """Make sure expired entries are served while they are refreshed in the background."""
+    import time
+
+    import nrk_psapi
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    calls = []
+
+    @nrk_psapi.caching.cache(expire=10, stale_while_revalidate=60)
+    async def f(x):
+        calls.append(x)
+        return len(calls)
+
+    assert await f(1) == 1
+
+    now += 20
+    assert await f(1) == 1
+    await asyncio.sleep(0.05)
+    assert len(calls) == 2
+    assert await f(1) == 2
+
+    nrk_psapi.caching.get_memory_cache().clear()
+    now += 20
+    assert await f(1) == 2
+    await asyncio.sleep(0.05)
+    assert await f(1) == 3
+
+    now += 100
+    assert await f(1) == 4
+    assert len(calls) == 4
+
+
+async def test_stale_while_revalidate_bulk(test_cache, monkeypatch, aresponses):
+    """Make sure background refreshes started by bulk calls are stored after their write batch is flushed."""
+    import time
+
+    import aiohttp
+    from aiohttp.web_response import json_response
+    from yarl import URL
+
+    import nrk_psapi
+    from nrk_psapi.const import PSAPI_BASE_URL
+
+    from .helpers import load_fixture_json
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    podcast_id = "desken_brenner"
+    episode_id = "l_8c60be4d-ce0b-41d0-a0be-4dce0b81d01a"
+    fixture = load_fixture_json(f"radio_catalog_podcast_{podcast_id}_episodes_{episode_id}")
+    refreshed = {**fixture, "titles": {**fixture["titles"], "title": "Refreshed"}}
+    path = f"/radio/catalog/podcast/{podcast_id}/episodes/{episode_id}"
+    aresponses.add(URL(PSAPI_BASE_URL).host, path, "GET", json_response(data=fixture))
+    aresponses.add(URL(PSAPI_BASE_URL).host, path, "GET", json_response(data=refreshed))
+
+    async with aiohttp.ClientSession() as session:
+        nrk_api = nrk_psapi.NrkPodcastAPI(
+            session=session,
+            cache_ttl={"get_episode": 10},
+            cache_stale_while_revalidate=60,
+        )
+        cache_key = nrk_api.get_episode.__cache_key__(nrk_api, podcast_id, episode_id)
+        [episode] = await nrk_api.get_episodes([(podcast_id, episode_id)])
+        assert episode.titles.title == fixture["titles"]["title"]
+
+        now += 20
+        [episode] = await nrk_api.get_episodes([(podcast_id, episode_id)])
+        assert episode.titles.title == fixture["titles"]["title"]
+        await asyncio.sleep(0.2)
+        assert nrk_psapi.get_cache().get(cache_key).titles.title == "Refreshed"
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_stale_while_revalidate_upstream_error(test_cache, monkeypatch, caplog):
+    """Make sure stale entries are kept when refreshing fails because the API is unavailable."""
+    import time
+
+    import nrk_psapi
+    from nrk_psapi.exceptions import NrkPsApiRateLimitError
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    fail = False
+
+    @nrk_psapi.caching.cache(expire=10)
+    async def f(x):
+        if fail:
+            raise NrkPsApiRateLimitError("Too many requests")
+        return x
+
+    nrk_psapi.caching.set_stale_while_revalidate(60)
+    assert await f(1) == 1
+
+    fail = True
+    now += 20
+    assert await f(1) == 1
+    await asyncio.sleep(0.05)
+    assert "serving stale data" in caplog.text
+    assert await f(1) == 1
+
+    now += 100
+    with pytest.raises(NrkPsApiRateLimitError):
+        await f(1)
+
+
+async def test_cache_ttl_policies(test_cache, monkeypatch):
+    """Make sure the cache TTL of a function can be overridden."""
+    import time
+
+    import nrk_psapi
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    calls = []
+
+    @test_cache
+    async def ttl_policy_fn(x):
+        calls.append(x)
+        return x
+
+    await ttl_policy_fn(1)
+    now += 20
+    await ttl_policy_fn(1)
+    assert len(calls) == 1
+
+    nrk_psapi.NrkPodcastAPI(cache_ttl={"ttl_policy_fn": 10})
+    assert nrk_psapi.caching.get_cache_ttl_policies() == {"ttl_policy_fn": 10}
+    nrk_psapi.clear_cache()
+    await ttl_policy_fn(1)
+    now += 20
+    await ttl_policy_fn(1)
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize(
+    ("headers", "stale", "cached"),
+    [
+        ({"Cache-Control": "max-age=30"}, None, True),
+        ({"Cache-Control": "max-age=5"}, None, False),
+        ({"Cache-Control": "no-store"}, None, False),
+        ({}, None, True),
+        ({"Cache-Control": "max-age=30"}, 60, True),
+        ({"Cache-Control": "no-store"}, 60, False),
+        ({"Cache-Control": "no-cache"}, 60, False),
+    ],
+)
+async def test_cache_ttl_from_headers(test_cache, monkeypatch, headers, stale, cached):
+    """Make sure the cache TTL can be derived from response headers."""
+    import time
+
+    import nrk_psapi
+    from nrk_psapi.caching import record_response_headers
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    nrk_psapi.NrkPodcastAPI(cache_ttl_from_headers=True, cache_stale_while_revalidate=stale)
+    calls = []
+
+    @test_cache
+    async def f(x):
+        calls.append(x)
+        record_response_headers(headers)
+        return x
+
+    await f(1)
+    now += 10
+    await f(1)
+    assert len(calls) == (1 if cached else 2)
+
+
+async def test_conditional_requests(test_cache, aresponses):
+    """Make sure responses are revalidated with ETag/Last-Modified, and reused when not modified."""
+    import aiohttp
+    from aiohttp.web_response import json_response
+    from yarl import URL
+
+    import nrk_psapi
+    from nrk_psapi.caching import invalidate_prefix
+    from nrk_psapi.const import PSAPI_BASE_URL
+
+    requests = []
+
+    async def response_handler(request):
+        requests.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return aresponses.Response(status=304)
+        return json_response(
+            data={"status": "ok"},
+            headers={"ETag": '"v1"', "Last-Modified": "Thu, 01 Jan 2026 00:00:00 GMT"},
+        )
+
+    aresponses.add(URL(PSAPI_BASE_URL).host, "/ipcheck", "GET", response_handler, repeat=4)
+
+    async with aiohttp.ClientSession() as session:
+        nrk_api = nrk_psapi.NrkPodcastAPI(session=session)
+
+        @test_cache
+        async def ipcheck():
+            return await nrk_api._request("ipcheck")
+
+        assert await ipcheck() == {"status": "ok"}
+        assert "If-None-Match" not in requests[0]
+        invalidate_prefix(f"{ipcheck.__module__}.{ipcheck.__qualname__}")
+        assert await ipcheck() == {"status": "ok"}
+        assert requests[1]["If-None-Match"] == '"v1"'
+        assert requests[1]["If-Modified-Since"] == "Thu, 01 Jan 2026 00:00:00 GMT"
+
+        # Responses outside cached functions are neither revalidated nor stored
+        nrk_psapi.clear_cache()
+        assert await nrk_api._request("ipcheck") == {"status": "ok"}
+        assert await nrk_api._request("ipcheck") == {"status": "ok"}
+        assert "If-None-Match" not in requests[3]
+        assert len(nrk_psapi.get_cache()) == 0
+
+
+async def test_cache_get_many(test_cache):
+    """Make sure many cached results are looked up at once, from both tiers."""
+    from nrk_psapi.caching import get_memory_cache
+
+    @test_cache
+    async def f(x):
+        return x * 2
+
+    await f(1)
+    await f(2)
+    get_memory_cache().delete(f.__cache_key__(2))
+
+    assert await f.__cache_get_many__([(1,), (2,), (3,)]) == {0: 2, 1: 4}
+    assert len(get_memory_cache()) == 2
+
+
+async def test_cache_get_set_many(test_cache):
+    from nrk_psapi.caching import cache_get_many, cache_set_many
+
+    await cache_set_many([("a", 1, None), ("b", 2, 60)])
+    entries = await cache_get_many(["a", "b", "c"])
+    assert set(entries) == {"a", "b"}
+    assert entries["a"] == (1, None)
+    assert entries["b"][0] == 2
+
+
+async def test_cache_write_batch(test_cache):
+    """Make sure batched writes only reach the disk cache when flushed."""
+    import nrk_psapi
+    from nrk_psapi.caching import CacheWriteBatch
+
+    store = []
+
+    @test_cache
+    async def f(x):
+        store.append(1)
+        return x
+
+    batch = CacheWriteBatch()
+    with batch.collect():
+        await asyncio.gather(f(1), f(2))
+    # Writes outside the block are not collected
+    await f(3)
+    assert len(batch) == 2
+    assert len(nrk_psapi.get_cache()) == 1
+
+    # The in-process cache is filled right away
+    await f(1)
+    assert len(store) == 3
+
+    await batch.flush()
+    assert len(batch) == 0
+    assert len(nrk_psapi.get_cache()) == 3
+
+    # Loads that outlive the flush of their batch are stored right away
+    release = asyncio.Event()
+
+    @test_cache
+    async def g(x):
+        await release.wait()
+        return x
+
+    with batch.collect():
+        task = asyncio.ensure_future(g(1))
+    await batch.flush()
+    release.set()
+    await task
+    assert len(batch) == 0
+    assert len(nrk_psapi.get_cache()) == 4
+
+
+async def test_undecodable_entries_are_misses(test_cache, monkeypatch):
+    """Make sure entries that fail to decode, e.g. after a model changed, are loaded again."""
+    from nrk_psapi import caching
+    from nrk_psapi.codec import CodecError
+
+    store = []
+
+    @test_cache
+    async def f(x):
+        store.append(1)
+        return x
+
+    await f(1)
+    caching.get_memory_cache().clear()
+
+    def decode(_data):
+        raise CodecError("Schema has changed")
+
+    monkeypatch.setattr(caching, "decode", decode)
+    assert await f(1) == 1
+    assert len(store) == 2
+
+
+async def test_cache_raw_responses(test_cache, aresponses):
+    """Make sure raw payloads are cached on disk, and models are built from them again."""
+    import aiohttp
+    from aiohttp.web_response import json_response
+    import orjson
+    from yarl import URL
+
+    import nrk_psapi
+    from nrk_psapi.caching import get_memory_cache, set_cache_raw_responses
+    from nrk_psapi.const import PSAPI_BASE_URL
+
+    from .helpers import load_fixture_json
+
+    podcast_id = "desken_brenner"
+    episode_id = "l_8c60be4d-ce0b-41d0-a0be-4dce0b81d01a"
+    uri = f"radio/catalog/podcast/{podcast_id}/episodes/{episode_id}"
+    fixture = load_fixture_json(f"radio_catalog_podcast_{podcast_id}_episodes_{episode_id}")
+    aresponses.add(URL(PSAPI_BASE_URL).host, f"/{uri}", "GET", json_response(data=fixture))
+
+    async with aiohttp.ClientSession() as session:
+        nrk_api = nrk_psapi.NrkPodcastAPI(session=session, cache_raw_responses=True)
+        episode = await nrk_api.get_episode(podcast_id, episode_id)
+        # Only the raw payload is stored on disk, besides the sets of its podcast and episode tags
+        assert len(nrk_psapi.get_cache()) == 3
+
+        get_memory_cache().clear()
+        assert await nrk_api.get_episode(podcast_id, episode_id) == episode
+        assert orjson.loads(await nrk_api.get_raw(uri)) == fixture
+    aresponses.assert_plan_strictly_followed()
+
+    # Results of functions making no API requests are still cached on disk
+    set_cache_raw_responses(True)
+    store = []
+
+    @test_cache
+    async def f(x):
+        store.append(x)
+        return [x]
+
+    assert await f(1) == [1]
+    get_memory_cache().clear()
+    assert await f(1) == [1]
+    assert store == [1]
+
+
+async def test_cache_size_limit(test_cache):
+    """Make sure culling evicts entries by the eviction policy while above the size limit."""
+    import nrk_psapi
+    from nrk_psapi.caching import cull_cache, set_cache_size_limit
+
+    set_cache_size_limit(None)
+    memory = nrk_psapi.get_cache()
+    for key in range(15):
+        memory.set(key, os.urandom(100_000))
+    memory.set("expired", 1, expire=-1)
+    # Nothing is evicted without a size limit, only expired entries are removed
+    assert await cull_cache() == 1
+    assert len(memory) == 15
+
+    # Entries are evicted in batches of 10, in the order they were stored by default
+    set_cache_size_limit(memory.volume() - 50_000)
+    memory.get(0)
+    assert await cull_cache() == 10
+    assert 0 not in memory
+    assert 14 in memory
+
+    # Reads count with the least-recently-used policy
+    for key in range(15, 30):
+        memory.set(key, os.urandom(100_000))
+    set_cache_size_limit(memory.volume() - 50_000, "least-recently-used")
+    memory.get(15)
+    assert await cull_cache() == 10
+    assert 15 in memory
+    assert 16 not in memory
+    assert 29 in memory
+
+    with pytest.raises(ValueError, match="Unknown eviction policy"):
+        set_cache_size_limit(1024, "none")
+
+
+async def test_cache_culling_task(test_cache, monkeypatch):
+    """Make sure the cache is culled in the background, until the client is closed."""
+    import nrk_psapi
+    from nrk_psapi import caching
+
+    culled = asyncio.Event()
+
+    async def cull_cache():
+        culled.set()
+        return 0
+
+    monkeypatch.setattr(caching, "cull_cache", cull_cache)
+    nrk_api = nrk_psapi.NrkPodcastAPI(cache_cull_interval=0.01, disable_credentials_storage=True)
+    async with nrk_api:
+        await asyncio.wait_for(culled.wait(), 1)
+        task = nrk_api._cull_task
+        assert not task.done()
+    assert task.cancelled()
+
+
+async def test_cache_shards(test_cache):
+    """Make sure a sharded cache spreads entries over the shards, behind the same decorator."""
+    from diskcache import FanoutCache
+
+    import nrk_psapi
+    from nrk_psapi.caching import cache_get_many, cache_set_many, get_memory_cache, set_cache_shards
+
+    set_cache_shards(4)
+    memory = nrk_psapi.get_cache()
+    assert isinstance(memory, FanoutCache)
+
+    store = []
+
+    @test_cache
+    async def f(x):
+        store.append(x)
+        return x
+
+    for x in range(20):
+        await f(x)
+    assert len(memory) == 20
+
+    get_memory_cache().clear()
+    await f(3)
+    assert len(store) == 20
+
+    await cache_set_many([(("key", x), x, None) for x in range(20)])
+    entries = await cache_get_many([("key", x) for x in range(25)])
+    assert {key[1]: value for key, (value, _) in entries.items()} == {x: x for x in range(20)}
+    assert all(len(shard) > 0 for shard in memory._shards)
+
+    set_cache_shards(None)
+    assert not isinstance(nrk_psapi.get_cache(), FanoutCache)
+
+    with pytest.raises(ValueError, match="at least 1"):
+        set_cache_shards(0)
+
+
+async def test_cache_write_behind(test_cache):
+    """Make sure writes are stored in the background in batches, through the cache executor."""
+    import threading
+
+    import nrk_psapi
+    from nrk_psapi.cache_backends import MemoryBackend
+    from nrk_psapi.caching import flush_cache_writes, set_cache_backend, set_cache_write_behind
+
+    class Backend(MemoryBackend):
+        def __init__(self):
+            super().__init__()
+            self.batches = []
+            self.threads = set()
+            self.release = threading.Event()
+
+        def set_many(self, entries):
+            self.release.wait(5)
+            self.batches.append(len(entries))
+            self.threads.add(threading.current_thread().name)
+            super().set_many(entries)
+
+    backend = Backend()
+    set_cache_backend(backend)
+    set_cache_write_behind(True)
+
+    @test_cache
+    async def f(x):
+        return x
+
+    await asyncio.gather(*(f(x) for x in range(10)))
+    # Results are returned before they are stored
+    assert len(backend) == 0
+    backend.release.set()
+    await flush_cache_writes()
+    assert len(backend) == 10
+    assert sum(backend.batches) == 10
+    assert len(backend.batches) < 10
+    assert all(name.startswith("nrk-psapi-cache") for name in backend.threads)
+
+    set_cache_write_behind(False)
+    set_cache_backend(None)
+    assert len(nrk_psapi.get_cache()) == 0
+
+
+async def test_invalidate(test_cache):
+    """Make sure entries are invalidated by tag, including the narrower tags of the same entries."""
+    import nrk_psapi
+    from nrk_psapi.caching import CacheWriteBatch, cache, get_memory_cache, invalidate
+
+    calls = []
+
+    @cache(tags=lambda _result, podcast_id: {"podcast": podcast_id})
+    async def get_podcast(podcast_id):
+        calls.append(("podcast", podcast_id))
+        return podcast_id
+
+    @cache(tags=lambda result, podcast_id: {"podcast": podcast_id, "episode": result})
+    async def get_episodes(podcast_id):
+        calls.append(("episodes", podcast_id))
+        return [f"{podcast_id}_1", f"{podcast_id}_2"]
+
+    @cache(tags=lambda _result, item_id: {"episode": item_id})
+    async def get_manifest(item_id):
+        calls.append(("manifest", item_id))
+        return item_id
+
+    async def call_all():
+        await get_podcast("a")
+        await get_podcast("b")
+        for podcast_id in ("a", "b"):
+            for episode_id in await get_episodes(podcast_id):
+                await get_manifest(episode_id)
+
+    await call_all()
+    assert len(calls) == 8
+
+    # Manifests are dropped with the podcast of their episodes
+    assert invalidate(podcast="a") == 4
+    calls.clear()
+    await call_all()
+    assert sorted(calls) == [("episodes", "a"), ("manifest", "a_1"), ("manifest", "a_2"), ("podcast", "a")]
+
+    assert invalidate(episode="b_2") == 2
+    assert invalidate(episode="b_2") == 0
+    calls.clear()
+    await call_all()
+    assert sorted(calls) == [("episodes", "b"), ("manifest", "b_2")]
+
+    # Tags collected in a write batch are stored with it
+    assert invalidate(podcast="b") == 4
+    batch = CacheWriteBatch()
+    with batch.collect():
+        await get_podcast("b")
+    assert invalidate(podcast="b") == 0
+    await batch.flush()
+    get_memory_cache().clear()
+    assert invalidate(podcast="b") == 1
+    assert nrk_psapi.get_cache().get(get_podcast.__cache_key__("b")) is None
+
+
+async def test_tag_expiry(test_cache):
+    """Make sure tags expire with the longest lived of the entries they tag."""
+    import time
+
+    import nrk_psapi
+    from nrk_psapi.caching import _TAG, cache, invalidate
+
+    @cache(expire=60, tags=lambda _result, podcast_id: {"podcast": podcast_id})
+    async def get_podcast(podcast_id):
+        return podcast_id
+
+    @cache(expire=None, tags=lambda _result, podcast_id: {"podcast": podcast_id})
+    async def get_metadata(podcast_id):
+        return podcast_id
+
+    await get_podcast("a")
+    _, expire_time = nrk_psapi.get_cache().get((_TAG, "podcast", "a"), expire_time=True)
+    assert expire_time == pytest.approx(time.time() + 60, abs=5)
+    await get_metadata("a")
+    _, expire_time = nrk_psapi.get_cache().get((_TAG, "podcast", "a"), expire_time=True)
+    assert expire_time is None
+    assert invalidate(podcast="a") == 2
+
+
+async def test_invalidate_queued_writes(test_cache):
+    """Make sure writes queued by write-behind caching or a write batch are invalidated too."""
+    import nrk_psapi
+    from nrk_psapi.caching import (
+        CacheWriteBatch,
+        cache,
+        flush_cache_writes,
+        invalidate,
+        set_cache_write_behind,
+    )
+
+    @cache(tags=lambda result, podcast_id: {"podcast": podcast_id, "episode": result})
+    async def get_episodes(podcast_id):
+        return [f"{podcast_id}_1"]
+
+    @cache(tags=lambda _result, item_id: {"episode": item_id})
+    async def get_manifest(item_id):
+        return item_id
+
+    batch = CacheWriteBatch()
+    with batch.collect():
+        for episode_id in await get_episodes("a"):
+            await get_manifest(episode_id)
+        await get_episodes("b")
+        assert invalidate(podcast="a") == 2
+    assert len(batch) == 1
+    assert batch.tag_updates
+    await batch.flush()
+    assert nrk_psapi.get_cache().get(get_episodes.__cache_key__("a")) is None
+    assert nrk_psapi.get_cache().get(get_manifest.__cache_key__("a_1")) is None
+    assert nrk_psapi.get_cache().get(get_episodes.__cache_key__("b")) == ["b_1"]
+
+    set_cache_write_behind(True)
+    try:
+        await get_manifest("c_1")
+        await get_manifest("c_2")
+        # Nothing is stored before the queue gets to run
+        assert invalidate(episode="c_1") == 1
+        await flush_cache_writes()
+    finally:
+        set_cache_write_behind(False)
+    assert nrk_psapi.get_cache().get(get_manifest.__cache_key__("c_1")) is None
+    assert nrk_psapi.get_cache().get(get_manifest.__cache_key__("c_2")) == "c_2"
+    assert invalidate(episode="c_1") == 0
+    assert invalidate(episode="c_2") == 1
+
+
+async def test_invalidate_prefix(test_cache):
+    """Make sure entries are invalidated by the name of their cached function."""
+    from nrk_psapi.caching import get_memory_cache, invalidate_prefix
+
+    store = []
+
+    @test_cache
+    async def f(x):
+        store.append(x)
+        return x
+
+    await f(1)
+    await f(2)
+    assert invalidate_prefix(f"{f.__module__}.{f.__qualname__}") == 2
+    assert invalidate_prefix("other") == 0
+    assert len(get_memory_cache()) == 0
+    await f(1)
+    assert store == [1, 2, 1]
@@ -0,0 +1,84 @@
+"""Tests for the cache codec."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+
+import cloudpickle
+import pytest
+
+from nrk_psapi.codec import CodecError, decode, encode
+
+from .helpers import load_fixture_json
+
+
+class Kind(Enum):
+    STANDARD = "standard"
+    UMBRELLA = "umbrella"
+
+
+@dataclass
+class Item:
+    name: str
+    kind: Kind
+
+
+@pytest.mark.parametrize(
+    "fixture_name",
+    [
+        "radio_catalog_podcast_hele_historien",
+        "radio_catalog_podcast_tore_sagens_podkast",
+    ],
+)
+def test_round_trip_model(fixture_name: str):
+    # Imported here, as other tests reload the package
+    from nrk_psapi.models.catalog import Podcast
+
+    podcast = Podcast.from_dict(load_fixture_json(fixture_name))
+    data = encode(podcast)
+    assert data.startswith(b"T")
+    assert len(data) < len(cloudpickle.dumps(podcast))
+    assert decode(data) == podcast
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        "value",
+        [Item("a", Kind.STANDARD)],
+        {"content_length": 1234, "content_type": "audio/mpeg"},
+        Kind.UMBRELLA,
+        b"\x00" * 2048,
+    ],
+)
+def test_round_trip(value):
+    assert decode(encode(value)) == value
+    assert decode(encode(value, compress_level=0)) == value
+
+
+def test_changed_schema():
+    data = encode([Item("a", Kind.STANDARD)])
+    header, _, body = data.partition(b"\n")
+    schema = encode(Item("a", Kind.STANDARD)).split(b'"tests.test_codec:Item","')[1][:12]
+    with pytest.raises(CodecError, match="Schema of tests.test_codec:Item has changed"):
+        decode(header.replace(schema, b"000000000000") + b"\n" + body)
+    with pytest.raises(CodecError, match="Schema of tests.test_codec:Missing has changed"):
+        decode(header.replace(b"tests.test_codec:Item", b"tests.test_codec:Missing") + b"\n" + body)
+
+
+def test_local_types_fall_back_to_cloudpickle():
+    @dataclass
+    class Local:
+        name: str
+
+    data = encode(Local("a"))
+    assert data.startswith(b"P")
+    assert decode(data).name == "a"
+
+
+def test_legacy_cloudpickle_data():
+    assert decode(cloudpickle.dumps({"a": 1})) == {"a": 1}
+    with pytest.raises(CodecError):
+        decode(b"garbage")
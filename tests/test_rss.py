@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import math
 import re
+from unittest.mock import patch
 
 from aiohttp import ClientSession
 from aiohttp.web_response import json_response
@@ -11,9 +12,10 @@ from aresponses import ResponsesMockServer
 import pytest
 from yarl import URL
 
-from nrk_psapi import NrkPodcastAPI, NrkPodcastFeed
+from nrk_psapi import Episode, NrkPodcastAPI, NrkPodcastFeed, Podcast
 from nrk_psapi.const import PSAPI_BASE_URL
 from nrk_psapi.models.rss import EpisodeChapter  # noqa: TCH001
+from nrk_psapi.rss import FeedStateStore
 
 from .helpers import load_fixture_json
 
@@ -100,18 +102,92 @@ async def test_build_rss_feed(aresponses: ResponsesMockServer, podcast_id: str):
             nrk_api,
             "http://example.com",
             rss_url_suffix=".rss",
+            concurrency=3,
         )
-        rss = await feed.build_podcast_rss(podcast_id, limit=10)
+        with patch.object(nrk_api, "get_episode", wraps=nrk_api.get_episode) as get_episode_mock:
+            rss = await feed.build_podcast_rss(podcast_id, limit=10)
+            # Chapters and contributors are missing from the listed episodes
+            assert get_episode_mock.call_count == 10
 
         assert rss.title == "Tore Sagens podkast"
         assert rss.link == f"http://example.com/{podcast_id}.rss"
         assert len(rss.items) == 10
+        assert [item.guid.guid for item in rss.items] == [
+            e["episodeId"] for e in episodes_fixture["_embedded"]["episodes"][:10]
+        ]
 
         xml = rss.rss()
         assert len(xml) > 0
-
+        assert xml.count("<podcast:chapters") == 2
         episode_id = episodes_fixture["_embedded"]["episodes"][0]["episodeId"]
+        assert f'url="http://example.com/{podcast_id}/{episode_id}/chapters.json"' in xml
+        assert xml.count("<podcast:person") == 10
+
         episode = await nrk_api.get_episode(podcast_id, episode_id)
         chapters: list[EpisodeChapter] = await feed.build_episode_chapters(episode)
         assert len(chapters) == 2
         assert all(isinstance(c, dict) for c in chapters)
+
+
+@pytest.mark.parametrize(
+    "podcast_id",
+    [
+        "tore_sagens_podkast",
+    ],
+)
+async def test_build_rss_feed_incremental(aresponses: ResponsesMockServer, podcast_id: str):
+    podcast_fixture = load_fixture_json(f"radio_catalog_podcast_{podcast_id}")
+    episodes_fixture = load_fixture_json(f"radio_catalog_podcast_{podcast_id}_episodes_page1")
+    aresponses.add(
+        URL(PSAPI_BASE_URL).host,
+        re.compile(r"/playback/manifest/podcast/.*"),
+        "GET",
+        json_response(
+            data=load_fixture_json("playback_manifest_podcast_l_9a443e59-5c18-45d8-843e-595c18b5d849")
+        ),
+        repeat=math.inf,
+    )
+    aresponses.add(
+        "podkast.nrk.no",
+        re.compile(r"/fil/.*"),
+        "HEAD",
+        aresponses.Response(
+            headers={
+                "Content-Length": "107587411",
+                "Content-Type": "audio/mpeg",
+            },
+        ),
+        repeat=math.inf,
+    )
+
+    async with ClientSession() as session:
+        nrk_api = NrkPodcastAPI(session=session, enable_cache=False)
+        state_store = FeedStateStore()
+        feed = NrkPodcastFeed(nrk_api, "http://example.com", state_store=state_store)
+        podcast = Podcast.from_dict(podcast_fixture)
+        episodes = [Episode.from_dict(e) for e in episodes_fixture["_embedded"]["episodes"]]
+        # Episodes with details, so they aren't fetched again
+        for episode in episodes:
+            episode.index_points = []
+            episode.contributors = []
+
+        with patch.object(
+            feed, "build_item_from_episode", wraps=feed.build_item_from_episode
+        ) as build_item_mock:
+            items = await feed.build_episode_items(episodes, podcast.series)
+            assert build_item_mock.call_count == len(episodes)
+            assert len(state_store.get_items(podcast.series.id)) == len(episodes)
+
+            build_item_mock.reset_mock()
+            assert await feed.build_episode_items(episodes, podcast.series) == items
+            build_item_mock.assert_not_called()
+
+            build_item_mock.reset_mock()
+            episodes[0].titles.title = "Changed title"
+            rebuilt_items = await feed.build_episode_items(episodes, podcast.series)
+            build_item_mock.assert_called_once()
+            assert rebuilt_items[0] is not items[0]
+            assert rebuilt_items[1:] == items[1:]
+
+        state_store.clear(podcast.series.id)
+        assert state_store.get_items(podcast.series.id) == {}
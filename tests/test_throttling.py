@@ -0,0 +1,356 @@
+"""Tests for client-side throttling."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import time
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+from aiohttp.web_response import json_response
+from aresponses import ResponsesMockServer
+import pytest
+from yarl import URL
+
+from nrk_psapi import NrkPodcastAPI
+from nrk_psapi.const import PSAPI_BASE_URL
+from nrk_psapi.exceptions import (
+    NrkPsApiCircuitOpenError,
+    NrkPsApiConnectionError,
+    NrkPsApiConnectionTimeoutError,
+    NrkPsApiNotFoundError,
+    NrkPsApiRateLimitError,
+    NrkPsApiServerError,
+)
+from nrk_psapi.throttling import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    CircuitState,
+    HedgePolicy,
+    LatencyTracker,
+    RetryBudget,
+    RetryPolicy,
+    TokenBucket,
+    get_endpoint_family,
+)
+
+from .helpers import load_fixture_json
+
+
+async def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=20, capacity=2)
+    start = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+    # Two tokens are available up front, the remaining four arrive at 20 per second.
+    assert time.monotonic() - start >= 0.18
+
+
+async def test_token_bucket_invalid_rate():
+    with pytest.raises(ValueError, match="Rate must be positive"):
+        TokenBucket(rate=0)
+
+
+async def test_adaptive_limit_decreases_on_overload():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+    with pytest.raises(NrkPsApiRateLimitError):
+        async with limiter.request():
+            raise NrkPsApiRateLimitError("slow down")
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+    # Other errors leave the limit alone
+    with pytest.raises(NrkPsApiNotFoundError):
+        async with limiter.request():
+            raise NrkPsApiNotFoundError("nope")
+    assert limiter.limit == 4
+
+
+async def test_adaptive_limit_decreases_once_per_wave():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+    entered = asyncio.Event()
+
+    async def overloaded():
+        async with limiter.request():
+            await entered.wait()
+            raise NrkPsApiRateLimitError("slow down")
+
+    tasks = [asyncio.create_task(overloaded()) for _ in range(4)]
+    await asyncio.sleep(0.01)
+    entered.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    assert limiter.limit == 4
+
+
+async def test_adaptive_limit_increases_on_success():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=4, min_limit=2)
+    for _ in range(3):
+        with pytest.raises(NrkPsApiRateLimitError):
+            async with limiter.request():
+                raise NrkPsApiRateLimitError("slow down")
+    assert limiter.limit == 2
+    for _ in range(10):
+        async with limiter.request():
+            pass
+    assert limiter.limit == 4
+
+
+async def test_adaptive_limit_bounds_concurrency():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=2)
+    active = 0
+    peak = 0
+
+    async def work():
+        nonlocal active, peak
+        async with limiter.request():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(work() for _ in range(6)))
+    assert peak == 2
+
+
+async def test_api_concurrency_limit(aresponses: ResponsesMockServer):
+    aresponses.add(
+        URL(PSAPI_BASE_URL).host,
+        "/radio/catalog/podcast/podcast",
+        "GET",
+        aresponses.Response(status=429),
+    )
+    async with ClientSession() as session:
+        nrk_api = NrkPodcastAPI(
+            session=session, enable_cache=False, max_concurrent_requests=4, rate_limit=100
+        )
+        assert nrk_api.concurrency_limit == 4
+        with pytest.raises(NrkPsApiRateLimitError):
+            await nrk_api.get_podcast("podcast")
+        assert nrk_api.concurrency_limit == 2
+
+    nrk_api = NrkPodcastAPI(enable_cache=False)
+    assert nrk_api.concurrency_limit is None
+
+
+def test_retry_policy_backoff():
+    policy = RetryPolicy(base_delay=1, max_delay=5)
+    for attempt, ceiling in enumerate([1, 2, 4, 5, 5]):
+        assert 0 <= policy.get_backoff(attempt) <= ceiling
+
+
+def test_retry_policy_delay():
+    policy = RetryPolicy(max_retries=2, max_delay=10, budget=None)
+    timeout = NrkPsApiConnectionTimeoutError("timeout")
+    assert policy.get_retry_delay("GET", 0, timeout) is not None
+    assert policy.get_retry_delay("GET", 2, timeout) is None
+    assert policy.get_retry_delay("POST", 0, timeout) is None
+    assert policy.get_retry_delay("GET", 0, NrkPsApiNotFoundError("nope")) is None
+    assert policy.get_retry_delay("GET", 0, NrkPsApiRateLimitError("slow down", retry_after=3)) == 3
+    assert policy.get_retry_delay("GET", 0, NrkPsApiRateLimitError("slow down", retry_after=60)) is None
+    assert policy.get_retry_delay("GET", 0, NrkPsApiServerError("down", status=503, retry_after=2)) == 2
+    assert policy.get_retry_delay("GET", 0, NrkPsApiServerError("down", status=502)) is not None
+    assert policy.get_retry_delay("GET", 0, NrkPsApiServerError("error", status=500)) is None
+
+
+def test_retry_budget():
+    budget = RetryBudget(ratio=0.5, min_retries=1, capacity=2)
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+    for _ in range(10):
+        budget.deposit()
+    assert budget.balance == 2
+
+
+async def test_api_retries(aresponses: ResponsesMockServer):
+    path = "/radio/catalog/podcast/podcast"
+    aresponses.add(
+        URL(PSAPI_BASE_URL).host,
+        path,
+        "GET",
+        aresponses.Response(status=429, headers={"Retry-After": "0"}),
+    )
+    aresponses.add(URL(PSAPI_BASE_URL).host, path, "GET", aresponses.Response(status=500))
+    aresponses.add(URL(PSAPI_BASE_URL).host, path, "GET", aresponses.Response(status=429))
+    aresponses.add(URL(PSAPI_BASE_URL).host, path, "GET", aresponses.Response(status=429))
+    async with ClientSession() as session:
+        nrk_api = NrkPodcastAPI(
+            session=session,
+            enable_cache=False,
+            retry_policy=RetryPolicy(max_retries=1, base_delay=0.01, budget=None),
+        )
+        # 500 is not a transient error, so it is not retried
+        with pytest.raises(NrkPsApiServerError):
+            await nrk_api.get_podcast("podcast")
+        with pytest.raises(NrkPsApiRateLimitError):
+            await nrk_api.get_podcast("podcast")
+    aresponses.assert_all_requests_matched()
+
+
+async def test_api_retries_server_errors(aresponses: ResponsesMockServer):
+    podcast_id = "hele_historien"
+    fixture = load_fixture_json(f"radio_catalog_podcast_{podcast_id}")
+    path = f"/radio/catalog/podcast/{podcast_id}"
+    aresponses.add(
+        URL(PSAPI_BASE_URL).host,
+        path,
+        "GET",
+        aresponses.Response(status=503, headers={"Retry-After": "0"}),
+    )
+    aresponses.add(URL(PSAPI_BASE_URL).host, path, "GET", aresponses.Response(status=502))
+    aresponses.add(URL(PSAPI_BASE_URL).host, path, "GET", json_response(data=fixture))
+    async with ClientSession() as session:
+        nrk_api = NrkPodcastAPI(
+            session=session,
+            enable_cache=False,
+            retry_policy=RetryPolicy(max_retries=2, base_delay=0.01, budget=None),
+        )
+        podcast = await nrk_api.get_podcast(podcast_id)
+        assert podcast.series.id == podcast_id
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_api_retry_budget(aresponses: ResponsesMockServer):
+    for _ in range(3):
+        aresponses.add(
+            URL(PSAPI_BASE_URL).host,
+            "/radio/catalog/podcast/podcast",
+            "GET",
+            aresponses.Response(status=429),
+        )
+    async with ClientSession() as session:
+        nrk_api = NrkPodcastAPI(
+            session=session,
+            enable_cache=False,
+            retry_policy=RetryPolicy(base_delay=0.01, budget=RetryBudget(ratio=0, min_retries=2)),
+        )
+        with pytest.raises(NrkPsApiRateLimitError):
+            await nrk_api.get_podcast("podcast")
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://psapi.nrk.no/radio/catalog/podcast/podcast", "catalog"),
+        ("https://psapi.nrk.no/playback/manifest/podcast/episode", "playback"),
+        ("https://psapi.nrk.no/radio/search/search/suggest", "search"),
+        ("https://psapi.nrk.no/radio/userdata/user/favourites", "userdata"),
+        ("https://psapi.nrk.no/", ""),
+    ],
+)
+def test_get_endpoint_family(url: str, expected: str):
+    assert get_endpoint_family(URL(url)) == expected
+
+
+async def _fail(breaker: CircuitBreaker, exception: Exception):
+    with pytest.raises(type(exception)):
+        async with breaker.request():
+            raise exception
+
+
+async def test_circuit_breaker():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_time=0.05)
+    await _fail(breaker, NrkPsApiConnectionTimeoutError("timeout"))
+    # Errors from a responding endpoint reset the failure count
+    await _fail(breaker, NrkPsApiNotFoundError("nope"))
+    await _fail(breaker, NrkPsApiConnectionTimeoutError("timeout"))
+    assert breaker.state == CircuitState.CLOSED
+    # Server errors mean the endpoint is failing
+    await _fail(breaker, NrkPsApiServerError("error", status=500))
+    assert breaker.state == CircuitState.OPEN
+    breaker.record_success()
+    await _fail(breaker, NrkPsApiConnectionTimeoutError("timeout"))
+    await _fail(breaker, NrkPsApiConnectionTimeoutError("timeout"))
+    assert breaker.state == CircuitState.OPEN
+    await _fail(breaker, NrkPsApiCircuitOpenError("open"))
+
+    await asyncio.sleep(0.05)
+    assert breaker.state == CircuitState.HALF_OPEN
+    # A failed probe opens the circuit again
+    await _fail(breaker, NrkPsApiConnectionError("down"))
+    assert breaker.state == CircuitState.OPEN
+
+    await asyncio.sleep(0.05)
+    async with breaker.request():
+        # Only one probe is let through
+        assert not breaker.allow_request()
+    assert breaker.state == CircuitState.CLOSED
+
+
+async def test_api_circuit_breaker():
+    async with ClientSession() as session:
+        nrk_api = NrkPodcastAPI(session=session, enable_cache=False, circuit_breaker_threshold=1)
+        with patch.object(session, "request", side_effect=socket.gaierror) as request_mock:
+            with pytest.raises(NrkPsApiConnectionError):
+                await nrk_api.get_episode("podcast", "episode")
+            assert nrk_api.circuit_states == {"catalog": CircuitState.OPEN}
+            with pytest.raises(NrkPsApiCircuitOpenError):
+                await nrk_api.get_episode("podcast", "episode")
+            assert request_mock.call_count == 1
+
+
+async def test_api_circuit_breaker_server_errors(aresponses: ResponsesMockServer):
+    aresponses.add(
+        URL(PSAPI_BASE_URL).host, "/radio/catalog/podcast/podcast", "GET", aresponses.Response(status=500)
+    )
+    async with ClientSession() as session:
+        nrk_api = NrkPodcastAPI(session=session, enable_cache=False, circuit_breaker_threshold=1)
+        with pytest.raises(NrkPsApiServerError):
+            await nrk_api.get_podcast("podcast")
+        assert nrk_api.circuit_states == {"catalog": CircuitState.OPEN}
+        with pytest.raises(NrkPsApiCircuitOpenError):
+            await nrk_api.get_podcast("podcast")
+    aresponses.assert_plan_strictly_followed()
+
+
+def test_latency_tracker():
+    tracker = LatencyTracker(window=10)
+    assert tracker.percentile(95) is None
+    for latency in range(20):
+        tracker.record(latency / 10)
+    assert len(tracker) == 10
+    assert tracker.percentile(50) == 1.4
+    assert tracker.percentile(95) == 1.9
+    assert tracker.percentile(0) == 1.0
+
+
+def test_hedge_policy_delay():
+    policy = HedgePolicy(percentile=75, min_samples=2, initial_delay=2, min_delay=0.1)
+    assert policy.get_delay("catalog") == 2
+    policy.record("catalog", 0.01)
+    policy.record("catalog", 0.02)
+    assert policy.get_delay("catalog") == 0.1
+    policy.record("catalog", 0.5)
+    policy.record("catalog", 0.6)
+    assert policy.get_delay("catalog") == 0.5
+    assert policy.get_delay("playback") == 2
+
+
+async def test_api_hedged_request(aresponses: ResponsesMockServer):
+    podcast_id = "desken_brenner"
+    episode_id = "l_8c60be4d-ce0b-41d0-a0be-4dce0b81d01a"
+    fixture = load_fixture_json(f"radio_catalog_podcast_{podcast_id}_episodes_{episode_id}")
+
+    async def slow_response(_request):
+        await asyncio.sleep(0.5)
+        return json_response(data=fixture)
+
+    path = f"/radio/catalog/podcast/{podcast_id}/episodes/{episode_id}"
+    aresponses.add(URL(PSAPI_BASE_URL).host, path, "GET", slow_response)
+    aresponses.add(URL(PSAPI_BASE_URL).host, path, "GET", json_response(data=fixture))
+
+    async with ClientSession() as session:
+        hedge_policy = HedgePolicy(initial_delay=0.05)
+        nrk_api = NrkPodcastAPI(
+            session=session, enable_cache=False, hedge_policy=hedge_policy, rate_limit=100
+        )
+        start = time.monotonic()
+        episode = await nrk_api.get_episode(podcast_id, episode_id)
+        assert time.monotonic() - start < 0.4
+        assert episode.episode_id == episode_id
+        assert len(hedge_policy.get_tracker("catalog")) == 1
+    aresponses.assert_all_requests_matched()
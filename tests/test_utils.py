@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from aiohttp import ClientSession
 from aresponses import ResponsesMockServer
+import pytest
 from yarl import URL
 
-from nrk_psapi.utils import fetch_file_info
+from nrk_psapi.utils import fetch_file_info, parse_cache_headers, parse_retry_after
 
 
 async def test_fetch_file_info(aresponses: ResponsesMockServer):
@@ -54,3 +55,43 @@ async def test_fetch_file_info_no_session(aresponses: ResponsesMockServer):
 
     assert file_info["content_length"] == int(expected_content_length)
     assert file_info["content_type"] == expected_content_type
+
+
+@pytest.mark.parametrize(
+    ("headers", "expected"),
+    [
+        ({}, None),
+        ({"Cache-Control": "public, max-age=300"}, 300),
+        ({"Cache-Control": "max-age=300, s-maxage=60"}, 60),
+        ({"Cache-Control": "max-age=300", "Age": "100"}, 200),
+        ({"Cache-Control": "no-store"}, 0),
+        ({"Cache-Control": "private, no-cache"}, 0),
+        (
+            {"Expires": "Thu, 01 Jan 2026 00:10:00 GMT", "Date": "Thu, 01 Jan 2026 00:00:00 GMT"},
+            600,
+        ),
+        (
+            {"Expires": "Thu, 01 Jan 2026 00:10:00 -0000", "Date": "Thu, 01 Jan 2026 00:00:00 GMT"},
+            600,
+        ),
+        ({"Expires": "Thu, 01 Jan 2026 00:10:00 -0000"}, 0),
+        ({"Expires": "0"}, 0),
+    ],
+)
+def test_parse_cache_headers(headers: dict[str, str], expected: float | None):
+    assert parse_cache_headers(headers) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("120", 120),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0),
+        ("Wed, 21 Oct 2015 07:28:00 -0000", 0),
+        ("soon", None),
+    ],
+)
+def test_parse_retry_after(value: str | None, expected: float | None):
+    assert parse_retry_after(value) == expected